@@ -5,10 +5,14 @@ Available Functions
 -------------------
 [Public]
 cubic_spline_interpolation(...): Apply cubic spline interpolation to resample sensor data at a given frequency.
+cubic_spline_interpolation_bundle(...): Apply cubic spline interpolation to several sensors, sharing one spline per time axis.
 slerp_interpolation(...): Perform SLERP (Spherical Linear Interpolation) over a quaternion time series.
 ------------------
 [Private]
 _convert_android_timestamp_to_seconds(...): Converts the time column from the android timestamp which is in nanoseconds to seconds.
+_slerp(...): Vectorized SLERP of unit quaternions onto a new time axis.
+_generate_new_time_axis(...): Generates an equidistant time axis within [start, stop) at a given sampling frequency.
+_get_num_new_samples(...): Gets the number of samples of an equidistant time axis within [start, stop).
 ------------------
 """
 
@@ -17,11 +21,10 @@ _convert_android_timestamp_to_seconds(...): Converts the time column from the an
 # ------------------------------------------------------------------------------------------------------------------- #
 import pandas as pd
 import numpy as np
-from scipy.spatial.transform import Rotation as R
-from scipy.spatial.transform import Slerp
 from scipy.interpolate import CubicSpline, interp1d
 from scipy.signal import resample_poly
 from constants import TIME_COLUMN_NAME
+from typing import List, Optional, Tuple
 import math
 # ------------------------------------------------------------------------------------------------------------------- #
 # file specific constants
@@ -29,6 +32,9 @@ import math
 # minimum difference between two HR instances (time)
 MIN_HR_DIFF = 2
 
+# dot product above which two quaternions are considered parallel (SLERP falls back to linear interpolation)
+SLERP_LINEAR_THRESHOLD = 0.9995
+
 
 # ------------------------------------------------------------------------------------------------------------------- #
 # public functions
@@ -44,35 +50,101 @@ def cubic_spline_interpolation(sensor_df: pd.DataFrame, fs: int = 100) -> pd.Dat
     :return: A DataFrame containing the resampled time axis and interpolated sensor values.
     """
 
-    # extract time axis
-    time_axis = sensor_df.iloc[:, 0]
-
-    # convert time axis to seconds (and cast to numpy.array)
-    time_axis = _convert_android_timestamp_to_seconds(time_axis).values
+    # extract time axis (as numpy.array) and convert it to seconds
+    time_axis = _convert_android_timestamp_to_seconds(sensor_df.iloc[:, 0].to_numpy())
 
-    # extract signals (and cast to numpy.array
-    signals = sensor_df.iloc[:, 1:].values
+    # extract signals (as numpy.array)
+    signals = sensor_df.iloc[:, 1:].to_numpy()
 
     # define the new time axis
-    time_axis_inter = np.arange(time_axis[0], time_axis[-1], 1 / fs)
+    time_axis_inter = _generate_new_time_axis(time_axis[0], time_axis[-1], fs)
 
-    # list for holding the interpolated signals
-    interpolated_signals = []
+    # init a single cubic spline interpolator for all channels (all channels share the same time axis)
+    cubic_spline_interpolator = CubicSpline(time_axis, signals, bc_type='natural', axis=0)
 
-    # cycle over the signal channels
-    for channel in range(signals.shape[1]):
-        # init cubic spline interpolator
-        cubic_spline_interpolator = CubicSpline(time_axis, signals[:, channel], bc_type='natural')
+    # preallocate the output array (time axis + interpolated channels)
+    interpolated_data = np.empty((time_axis_inter.size, signals.shape[1] + 1))
+    interpolated_data[:, 0] = time_axis_inter
 
-        # interpolate the signal and append to interpolated signals
-        interpolated_signals.append(cubic_spline_interpolator(time_axis_inter))
+    # interpolate all signal channels at once
+    interpolated_data[:, 1:] = cubic_spline_interpolator(time_axis_inter)
 
     # create interpolated DataFrame
-    interpolated_df = pd.DataFrame(np.column_stack([time_axis_inter] + interpolated_signals), columns=sensor_df.columns)
+    interpolated_df = pd.DataFrame(interpolated_data, columns=sensor_df.columns, copy=False)
 
     return interpolated_df
 
 
+def cubic_spline_interpolation_bundle(sensor_dfs: List[pd.DataFrame], fs: int = 100) -> List[pd.DataFrame]:
+    """
+    Apply cubic spline interpolation to several sensors at once (e.g., ACC, GYR, and MAG of the same device).
+    Sensors that share the exact same time axis are stacked into a single DataFrame and interpolated with one
+    vector-valued cubic spline, while sensors with their own time axis are interpolated separately. The first column of
+    each DataFrame is assumed to be the time axis, while the remaining columns contain sensor measurements.
+
+    :param sensor_dfs: A list of DataFrames containing timestamps in the first column and sensor data in the remaining
+                       columns.
+    :param fs: The target sampling frequency in Hz. Default: 100 (Hz)
+    :return: A list of DataFrames (in the same order as sensor_dfs) containing the resampled time axis and
+             interpolated sensor values.
+    """
+
+    # list for holding the interpolated DataFrames (in the same order as sensor_dfs)
+    interpolated_dfs: List[Optional[pd.DataFrame]] = [None] * len(sensor_dfs)
+
+    # list for holding the groups of sensors that share the same time axis (time axis, list of sensor indices)
+    time_axis_groups: List[Tuple[np.ndarray, List[int]]] = []
+
+    # (1) group the sensors by time axis
+    for num, sensor_df in enumerate(sensor_dfs):
+
+        time_axis = sensor_df.iloc[:, 0].to_numpy()
+
+        for group_time_axis, group_indices in time_axis_groups:
+
+            # add to the group if the time axis is the same
+            if np.array_equal(group_time_axis, time_axis):
+                group_indices.append(num)
+                break
+
+        else:
+            # create a new group
+            time_axis_groups.append((time_axis, [num]))
+
+    # (2) interpolate each group with a single spline
+    for group_time_axis, group_indices in time_axis_groups:
+
+        # only one sensor with this time axis
+        if len(group_indices) == 1:
+            interpolated_dfs[group_indices[0]] = cubic_spline_interpolation(sensor_dfs[group_indices[0]], fs=fs)
+            continue
+
+        # stack the time axis and the signals of all sensors in the group
+        stacked_data = np.column_stack([group_time_axis] + [sensor_dfs[num].iloc[:, 1:].to_numpy()
+                                                             for num in group_indices])
+        stacked_columns = [sensor_dfs[group_indices[0]].columns[0]] + [column for num in group_indices
+                                                                        for column in sensor_dfs[num].columns[1:]]
+
+        # interpolate all the sensors at once
+        interpolated_data = cubic_spline_interpolation(pd.DataFrame(stacked_data, columns=stacked_columns),
+                                                       fs=fs).to_numpy()
+
+        # split the interpolated data back into one DataFrame per sensor
+        column = 1
+        for num in group_indices:
+
+            # get the number of signal columns of the sensor
+            num_channels = sensor_dfs[num].shape[1] - 1
+
+            interpolated_dfs[num] = pd.DataFrame(
+                np.column_stack((interpolated_data[:, 0], interpolated_data[:, column:column + num_channels])),
+                columns=sensor_dfs[num].columns, copy=False)
+
+            column += num_channels
+
+    return interpolated_dfs
+
+
 def slerp_interpolation(rotvec_df: pd.DataFrame, fs: int = 100) -> pd.DataFrame:
     """
     Perform SLERP (Spherical Linear Interpolation) over a quaternion time series.
@@ -85,30 +157,24 @@ def slerp_interpolation(rotvec_df: pd.DataFrame, fs: int = 100) -> pd.DataFrame:
     :return: A DataFrame containing the interpolated timestamps and quaternions.
     """
 
-    # extract time axis
-    time_axis = rotvec_df.iloc[:, 0]
+    # extract time axis (as numpy.array) and convert it to seconds
+    time_axis = _convert_android_timestamp_to_seconds(rotvec_df.iloc[:, 0].to_numpy())
 
-    # convert time axis to seconds (and cast to numpy.array)
-    time_axis = _convert_android_timestamp_to_seconds(time_axis).values
-
-    # get the quaterion data
-    quaternion_data = rotvec_df.iloc[:, 1:].values
-
-    # convert quaternions to Rotation objects
-    rotations = R.from_quat(quaternion_data)
+    # get the quaterion data (as numpy.array)
+    quaternion_data = rotvec_df.iloc[:, 1:].to_numpy()
 
     # define new time axis
-    time_axis_inter = np.arange(time_axis[0], time_axis[-1], 1 / fs)
+    time_axis_inter = _generate_new_time_axis(time_axis[0], time_axis[-1], fs)
 
-    # init SLERP interpolator
-    slerp_interpolator = Slerp(time_axis, rotations)
+    # preallocate the output array (time axis + quaternion data)
+    rotvec_interpolated_data = np.empty((time_axis_inter.size, quaternion_data.shape[1] + 1))
+    rotvec_interpolated_data[:, 0] = time_axis_inter
 
-    # interpolate the rotations
-    interpolated_rotations = slerp_interpolator(time_axis_inter)
+    # interpolate the quaternions
+    rotvec_interpolated_data[:, 1:] = _slerp(time_axis, quaternion_data, time_axis_inter)
 
-    # create interpolated DataFrame (stack time axis and quaternion data + convert result back to quaterions)
-    rotvec_interpolated_df = pd.DataFrame(np.column_stack((time_axis_inter, interpolated_rotations.as_quat())),
-                                          columns=rotvec_df.columns)
+    # create interpolated DataFrame
+    rotvec_interpolated_df = pd.DataFrame(rotvec_interpolated_data, columns=rotvec_df.columns, copy=False)
 
     return rotvec_interpolated_df
 
@@ -123,32 +189,28 @@ def zero_order_hold_interpolation(sensor_df: pd.DataFrame, fs: int = 100) -> pd.
     :param fs: The target sampling frequency in Hz. Default: 100 (Hz)
     :return: A DataFrame containing the resampled time axis and interpolated sensor values.
     """
-    # extract time axis
-    time_axis = sensor_df.iloc[:, 0]
+    # extract time axis (as numpy.array) and convert it to seconds
+    time_axis = _convert_android_timestamp_to_seconds(sensor_df.iloc[:, 0].to_numpy())
 
-    # convert time axis to seconds (and cast to numpy.array)
-    time_axis = _convert_android_timestamp_to_seconds(time_axis).values
-
-    # extract signals (and cast to numpy.array
-    signals = sensor_df.iloc[:, 1:].values
+    # extract signals (as numpy.array)
+    signals = sensor_df.iloc[:, 1:].to_numpy()
 
     # define the new time axis
-    time_axis_inter = np.arange(time_axis[0], time_axis[-1], 1 / fs)
+    time_axis_inter = _generate_new_time_axis(time_axis[0], time_axis[-1], fs)
 
-    # list for holding the interpolated signals
-    interpolated_signals = []
+    # init a single zero hold interpolator for all channels (all channels share the same time axis)
+    zero_order_hold_interpolator = interp1d(time_axis, signals, kind='previous', axis=0, assume_sorted=True,
+                                            copy=False)
 
-    # cycle over the signal channels
-    for channel in range(signals.shape[1]):
+    # preallocate the output array (time axis + interpolated channels)
+    interpolated_data = np.empty((time_axis_inter.size, signals.shape[1] + 1))
+    interpolated_data[:, 0] = time_axis_inter
 
-        # init zero hold interpolator
-        zero_order_hold_interpolator = interp1d(time_axis, signals[:, channel], kind='previous')
-
-        # interpolate the signal and append to interpolated signals
-        interpolated_signals.append(zero_order_hold_interpolator(time_axis_inter))
+    # interpolate all signal channels at once
+    interpolated_data[:, 1:] = zero_order_hold_interpolator(time_axis_inter)
 
     # create interpolated DataFrame
-    interpolated_df = pd.DataFrame(np.column_stack([time_axis_inter] + interpolated_signals), columns=sensor_df.columns)
+    interpolated_df = pd.DataFrame(interpolated_data, columns=sensor_df.columns, copy=False)
 
     return interpolated_df
 
@@ -166,14 +228,14 @@ def interpolate_heart_rate_sensor(sensor_df: pd.DataFrame, fs: int = 100) -> pd.
     :param fs: The target sampling frequency in Hz. Default: 100 (Hz)
     :return: A DataFrame containing the interpolated timestamps and heart rate data.
     """
-    # list for holding the interpolated segments of the HR sensor
-    interpolated_segments = []
+    # list for holding the segments of the HR sensor (start index, stop index, and number of interpolated samples)
+    segments = []
 
-    # extract time axis
-    time_axis = sensor_df.iloc[:, 0]
+    # extract time axis (as numpy.array) and convert it to seconds
+    time_axis = _convert_android_timestamp_to_seconds(sensor_df.iloc[:, 0].to_numpy())
 
-    # convert time axis to seconds (and cast to numpy.array)
-    time_axis = _convert_android_timestamp_to_seconds(time_axis).values
+    # extract the HR data (as numpy.array)
+    hr_data = sensor_df.iloc[:, 1].to_numpy()
 
     # the HR sensor acquires for approx 1 minute and stops for the next 3
     # find where the indices of when the sensor stopped acquiring - where the difference is not 1
@@ -185,39 +247,44 @@ def interpolate_heart_rate_sensor(sensor_df: pd.DataFrame, fs: int = 100) -> pd.
     # get all stop indies -> len(time_axis) -1 adds the last index as a stop
     stop_indices = np.append(breaks, len(time_axis) - 1)
 
-    # cycle over the start and stop indices
+    # (1) cycle over the start and stop indices to get the number of interpolated samples of each segment
     for start, stop in zip(start_indices, stop_indices):
 
-        # get the segment of the HR sensor (+1 to include the stop)
-        hr_segment_df = sensor_df.iloc[start:stop+1]
-
         # get only the segment of the full tima axis (+1 to include the stop)
         time_axis_segment = time_axis[start:stop+1]
 
         # if segments have less than 2 samples, can not interpolate
-        if len(hr_segment_df) < 2:
+        if len(time_axis_segment) < 2:
             continue
 
         time_axis_segment[0] = np.floor(time_axis_segment[0])
 
-        # define the new time axis
-        time_axis_inter = np.arange(time_axis_segment[0], time_axis_segment[-1], 1 / fs)
+        # append to list of segments (only the size of the new time axis is needed to allocate the output)
+        segments.append((start, stop, _get_num_new_samples(time_axis_segment[0], time_axis_segment[-1], fs)))
 
-        # init zero hold interpolator
-        zero_order_hold_interpolator = interp1d(time_axis_segment, hr_segment_df.values[:, 1], kind='previous')
+    # preallocate the output array for all segments (time axis + HR data)
+    interpolated_data = np.empty((sum(num_samples for _, _, num_samples in segments), 2))
 
-        # interpolate HR data
-        interpolated_hr_data = zero_order_hold_interpolator(time_axis_inter)
+    # (2) cycle over the segments and write the interpolated data into the output array
+    row = 0
+    for start, stop, num_samples in segments:
+
+        # get the rows of the output array that belong to the segment
+        segment_rows = slice(row, row + num_samples)
+        row += num_samples
 
-        # create interpolated DataFrame (stack time axis and sensor data)
-        interpolated_segment_df = pd.DataFrame(np.column_stack((time_axis_inter, interpolated_hr_data)),
-                                              columns=sensor_df.columns)
+        # define the new time axis (generated per segment, so only one segment's time axis is held at a time)
+        time_axis_inter = _generate_new_time_axis(time_axis[start], time_axis[stop], fs)
+        interpolated_data[segment_rows, 0] = time_axis_inter
 
-        # append to list of segments
-        interpolated_segments.append(interpolated_segment_df)
+        # zero order hold: get the index of the last sample taken at or before each new timestamp (+1 to include the stop)
+        hold_indices = np.searchsorted(time_axis[start:stop+1], time_axis_inter, side='right') - 1
 
-    # concat all segments into one df
-    interpolated_df = pd.concat(interpolated_segments, ignore_index=True)
+        # interpolate HR data
+        interpolated_data[segment_rows, 1] = hr_data[start:stop+1][hold_indices]
+
+    # create interpolated DataFrame
+    interpolated_df = pd.DataFrame(interpolated_data, columns=sensor_df.columns, copy=False)
 
     return interpolated_df
 
@@ -278,24 +345,116 @@ def resample_signals(sensor_df: pd.DataFrame, fs, fs_new) -> pd.DataFrame:
 # ------------------------------------------------------------------------------------------------------------------- #
 # private functions
 # ------------------------------------------------------------------------------------------------------------------- #
-def _convert_android_timestamp_to_seconds(time_column: pd.Series) -> pd.Series:
+def _convert_android_timestamp_to_seconds(time_axis: np.ndarray) -> np.ndarray:
     """
-    Converts the time column from the android timestamp which is in nanoseconds to seconds.
+    Converts the time axis from the android timestamp which is in nanoseconds to seconds. The time axis is always
+    assumed to be in nanoseconds (as loaded from the raw android files). A new array is returned.
 
-    :param time_column: The column of the sensor dataframe containing the time axis
-    :return: the converted time axis as pd.Series.
+    :param time_axis: numpy.array containing the time axis of the sensor data (in nanoseconds)
+    :return: the converted time axis as numpy.array.
     """
 
-    # get the first entry of the column
-    time_0 = time_column.iloc[0]
+    # subtract the first entry from the entire time axis (allocates the only output array)
+    time_axis_seconds = np.subtract(time_axis, time_axis[0], dtype=np.float64)
 
-    # subtract the first entry from the entire column
-    time_column = time_column - time_0
+    # convert from nanoseconds to seconds (in-place)
+    time_axis_seconds *= 1e-9
 
-    # convert from nanoseconds to seconds
-    time_column = time_column * 1e-9
+    return time_axis_seconds
+
+
+def _slerp(time_axis: np.ndarray, quaternion_data: np.ndarray, time_axis_inter: np.ndarray) -> np.ndarray:
+    """
+    Vectorized SLERP (Spherical Linear Interpolation) of unit quaternions. Each new timestamp is interpolated between
+    the two original quaternions surrounding it, always following the shortest arc. For (nearly) parallel quaternions,
+    linear interpolation followed by normalization is used instead, since sin(theta) tends to zero.
+
+    :param time_axis: numpy.array containing the original (strictly increasing) time axis in seconds.
+    :param quaternion_data: numpy.array of shape (n_samples, 4) containing the quaternions (x, y, z, w).
+    :param time_axis_inter: numpy.array containing the new time axis. All values must lie within
+                            [time_axis[0], time_axis[-1]].
+    :return: numpy.array of shape (len(time_axis_inter), 4) containing the interpolated unit quaternions.
+    """
+
+    # normalize the quaternions
+    quaternion_data = quaternion_data / np.linalg.norm(quaternion_data, axis=1, keepdims=True)
+
+    # get the index of the original sample at or before each new timestamp
+    # (clamped to the last interval, so that a timestamp equal to time_axis[-1] is interpolated with alpha = 1)
+    indices = np.clip(np.searchsorted(time_axis, time_axis_inter, side='right') - 1, 0, len(time_axis) - 2)
+
+    # get the quaternions surrounding each new timestamp
+    q0 = quaternion_data[indices]
+    q1 = quaternion_data[indices + 1]
+
+    # get the position of each new timestamp within its interval (0 -> q0, 1 -> q1)
+    alpha = (time_axis_inter - time_axis[indices]) / (time_axis[indices + 1] - time_axis[indices])
+
+    # get the cosine of the angle between the quaternions
+    dot = np.einsum('ij,ij->i', q0, q1)
+
+    # flip q1 when the dot product is negative to follow the shortest arc
+    negative_dot = dot < 0
+    q1[negative_dot] *= -1
+    dot = np.abs(dot)
+
+    # use linear interpolation when the quaternions are (nearly) parallel
+    linear = dot > SLERP_LINEAR_THRESHOLD
+
+    # get the angle between the quaternions
+    theta = np.arccos(np.clip(dot, -1.0, 1.0))
+    sin_theta = np.sin(theta)
+
+    # calculate the weights of both quaternions
+    weight_0 = np.divide(np.sin((1 - alpha) * theta), sin_theta, out=1 - alpha, where=~linear)
+    weight_1 = np.divide(np.sin(alpha * theta), sin_theta, out=alpha.copy(), where=~linear)
+
+    # interpolate
+    interpolated_quaternions = weight_0[:, np.newaxis] * q0 + weight_1[:, np.newaxis] * q1
+
+    # normalize the linearly interpolated quaternions
+    interpolated_quaternions[linear] /= np.linalg.norm(interpolated_quaternions[linear], axis=1, keepdims=True)
+
+    return interpolated_quaternions
+
+
+def _generate_new_time_axis(start: float, stop: float, fs: int) -> np.ndarray:
+    """
+    Generates an equidistant time axis in seconds within [start, stop), sampled at fs Hz. The timestamps are computed
+    from an integer sample count (start + n / fs), thus avoiding the accumulated rounding of a float step.
+
+    :param start: the first timestamp (in seconds)
+    :param stop: the end of the time axis (in seconds), not included
+    :param fs: the sampling frequency in Hz
+    :return: the new time axis as numpy.array
+    """
+
+    return start + np.arange(_get_num_new_samples(start, stop, fs)) / fs
+
+
+def _get_num_new_samples(start: float, stop: float, fs: int) -> int:
+    """
+    Gets the number of samples of an equidistant time axis within [start, stop), sampled at fs Hz.
+
+    :param start: the first timestamp (in seconds)
+    :param stop: the end of the time axis (in seconds), not included
+    :param fs: the sampling frequency in Hz
+    :return: the number of samples
+    """
+
+    # number of samples of the half-open interval [start, stop)
+    num_samples = max(int(np.ceil((stop - start) * fs)), 0)
+
+    # correct the rounding of (stop - start) * fs, which can be off by one sample when the span is (close to) an exact
+    # multiple of 1 / fs: the last sample must lie strictly before stop, and the next one at or after stop
+    if num_samples > 0 and start + (num_samples - 1) / fs >= stop:
+        num_samples -= 1
+
+    elif start + num_samples / fs < stop:
+        num_samples += 1
+
+    return num_samples
 
-    return time_column
 
 def _generate_time_column_from_samples(signal_size:int, fs: int):
 
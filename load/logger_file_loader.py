@@ -5,11 +5,10 @@ Functions to load and parse logger files in order to extract the initial data co
 Available Functions
 -------------------
 [Public]
-load_logger_file_info(...): Parses a logger file and extracts the data collection start timestamp for each device.
+load_logger_file_info(...): Parses a logger file and extracts the data collection start timestamp for each device (None if the folder has no non-empty logger file).
 -------------------
 
 [Private]
-_check_logger_file(...): Checks whether a valid logger file exists in the folder.
 _filter_logger_file(...): Filters the logger DataFrame to include only rows relevant to device start times.
 _get_device_start_time(...): Retrieves the data collection start timestamp for a given device.
 _find_android_logger_timestamps(...): Finds the initial timestamp for Android devices (WATCH or PHONE).
@@ -22,7 +21,6 @@ _find_mban_logger_timestamps(...): Finds the last recorded timestamp for MuscleB
 # ------------------------------------------------------------------------------------------------------------------- #
 import os
 import pandas as pd
-import glob
 from typing import Optional, Dict, Set
 import re
 
@@ -39,6 +37,14 @@ LOG = 'log'
 LOGGER_FILE_COLUMNS = [TIMESTAMP, LOG]
 WATCH_IDENTIFIER = 'WEAR'
 NOISE_RECORDER = 'NOISERECORDER'
+FIRST_DATA_PREFIX = 'SENSOR_DATA: received first data from'
+LOGGER_FILENAME_PREFIX = 'opensignals_ACQUISITION_LOG_'
+
+# log entries of the first data received from a sensor/device (the group holds the text after the prefix)
+FIRST_DATA_PATTERN = re.compile(re.escape(FIRST_DATA_PREFIX) + r'(.*)')
+
+# mac address in the log entries: XX:XX:XX:XX:XX:XX (X are numbers or upper case letters)
+MAC_ADDRESS_PATTERN = re.compile(r"\b(?:[0-9A-F]{2}:){5}[0-9A-F]{2}\b")
 
 # ------------------------------------------------------------------------------------------------------------------- #
 # public functions
@@ -59,7 +65,7 @@ def load_logger_file_info(folder_path: str) -> Optional[Dict[str, str]]:
 
     :param folder_path: Path to the folder containing the logger file and sensor data files.
     :return: A dictionary mapping each detected device to the timestamp of its data collection start,
-             or None if no logger file is found.
+             or None if no (non-empty) logger file is found.
              Example: {"WATCH": "10:15:23.123", "F0A55C68B2E1": "10:16:45.987"}
     """
     # innit dictionary to store the start times of the devices
@@ -72,26 +78,37 @@ def load_logger_file_info(folder_path: str) -> Optional[Dict[str, str]]:
     logger_filepath: Optional[str] = None
 
     # (1) identify the devices based on the filename and locate the logger file
-    for filename in os.listdir(folder_path):
+    with os.scandir(folder_path) as entries:
+
+        for entry in entries:
+
+            # check if it found a device
+            device = extract_device_from_filename(entry.name)
 
-        # check if it found a device
-        device = extract_device_from_filename(filename)
+            # found a device, add to set
+            if device:
+                detected_devices.add(device)
 
-        # found a device, add to set
-        if device:
-            detected_devices.add(device)
+            # found the logger file (only if it is not empty - the file size is taken from the directory entry)
+            elif entry.name.startswith(LOGGER_FILENAME_PREFIX) and entry.is_file() and entry.stat().st_size > 0:
+                logger_filepath = entry.path
 
-         # found the logger file
-        else:
-            logger_filepath = os.path.join(folder_path, filename)
+    # no (valid) logger file in the folder
+    if logger_filepath is None:
+        return None
 
     # (2) load and filter the logger file
     # load raw logger file into dataframe
-    logger_df = pd.read_csv(logger_filepath, sep='\t', header=None, skiprows=3, names=LOGGER_FILE_COLUMNS)
+    # (both columns are read as str - the timestamps are in hh:mm:ss.000 format - skipping type inference)
+    logger_df = pd.read_csv(logger_filepath, sep='\t', header=None, skiprows=3, names=LOGGER_FILE_COLUMNS,
+                            dtype={TIMESTAMP: str, LOG: str}, engine='c')
 
     # filter dataframe, to get only the timestamps for each device and sensor
     logger_df = _filter_logger_file(logger_df)
 
+    # start times of the devices taken from the filenames (only scanned when needed, and at most once)
+    folder_device_start_times_dict: Optional[Dict[str, str]] = None
+
     # (3) Find the start time of the data collection for each detected device, based on the log entries
     for device in detected_devices:
 
@@ -103,7 +120,8 @@ def load_logger_file_info(folder_path: str) -> Optional[Dict[str, str]]:
         if any(timestamp == '' for timestamp in device_start_times_dict.values()):
 
             # get all timestamps from the folder names
-            folder_device_start_times_dict = get_device_filename_timestamp(folder_path)
+            if folder_device_start_times_dict is None:
+                folder_device_start_times_dict = get_device_filename_timestamp(folder_path)
 
             # fill in only the missing timestamps (those with '')
             for device_name, timestamp in device_start_times_dict.items():
@@ -131,27 +149,25 @@ def _filter_logger_file(logger_df: pd.DataFrame) -> pd.DataFrame:
     - The first column contains timestamps.
     - The second column (identified by the constant `LOG`) contains log messages.
 
-    It selects only the rows where the log message starts with:
+    It selects only the rows where the log message contains:
         "SENSOR_DATA: received first data from"
     These entries indicate the initial timestamp of data received from a sensor/device.
 
-    After filtering, the function removes the prefix
-        "SENSOR_DATA: received first data from"
-    from each log entry, leaving only the name of the corresponding sensor/device
-    (e.g., "SENSOR_DATA: received first data from WEAR_ACCELEROMETER" becomes "WEAR_ACCELEROMETER").
+    The log entries are filtered and stripped in a single pass, keeping only the text after the prefix, which is the
+    name of the corresponding sensor/device
+    (e.g., "SENSOR_DATA: received first data from WEAR_ACCELEROMETER" becomes " WEAR_ACCELEROMETER").
 
     :param logger_df: A pandas DataFrame containing timestamped log messages.
     :return: The filtered dataframe
     """
 
-    # keep only the rows that have : "SENSOR_DATA: received first data from"
-    logger_df = logger_df[logger_df[LOG].str.contains("SENSOR_DATA: received first data from")]
+    # get the text after "SENSOR_DATA: received first data from" (NaN for the rows that do not have it)
+    device_names = logger_df[LOG].str.extract(FIRST_DATA_PATTERN, expand=False)
 
-    # remove the prefix, keeping only the device name on the log column
-    logger_df.loc[:, LOG] = logger_df[LOG].str.replace("SENSOR_DATA: received first data from", "",
-                                                                 regex=False)
+    # keep only the rows that have the prefix, with the device name on the log column
+    has_prefix = device_names.notna()
 
-    return logger_df
+    return logger_df[has_prefix].assign(**{LOG: device_names[has_prefix]})
 
 
 def _get_device_start_time(logger_df: pd.DataFrame, device: str) -> Dict[str, str]:
@@ -282,13 +298,10 @@ def _find_mban_logger_timestamps(filtered_logger_df: pd.DataFrame, device: str)
     # Reverse the DataFrame to find the last occurrence
     reversed_df = filtered_logger_df.iloc[::-1]
 
-    # search for rows with a mac address: XX:XX:XX:XX:XX:XX (X are numbers or upper case letters)
-    mac_pattern = r"\b(?:[0-9A-F]{2}:){5}[0-9A-F]{2}\b"
-
     for _, row in reversed_df.iterrows():
 
         # Search for MAC address in log entry
-        if match := re.search(mac_pattern, row[LOG]):
+        if match := MAC_ADDRESS_PATTERN.search(row[LOG]):
 
             # remove colons since the device name provided does not have the columns
             mac_stripped = match.group().replace(":", "")
@@ -5,29 +5,45 @@ Available Functions
 -------------------
 [Public]
 load_meta_data(): loads the meta-data contained in subjects_info.csv into a pandas.DataFrame.
-
+get_muscleban_side(...): Extracts the side of the muscleban based on its mac address.
+get_expected_devices(...): Returns the devices expected for a subject (phone, watch, and both musclebans).
 ------------------
 [Private]
-
+_read_meta_data(...): Reads subjects_info.csv (cached per file path and modification time).
+_get_mban_side_map(...): Builds a dictionary mapping each muscleban mac address to its side.
+------------------
 """
 
 # ------------------------------------------------------------------------------------------------------------------- #
 # imports
 # ------------------------------------------------------------------------------------------------------------------- #
+import os
 import pandas as pd
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Dict
 from constants import PHONE, WATCH, MBAN_LEFT, MBAN_RIGHT
 
+# ------------------------------------------------------------------------------------------------------------------- #
+# file specific constants
+# ------------------------------------------------------------------------------------------------------------------- #
+# name of the file containing the meta-data (relative to the working directory)
+META_DATA_FILENAME = 'subjects_info.csv'
+
 # ------------------------------------------------------------------------------------------------------------------- #
 # public functions
 # ------------------------------------------------------------------------------------------------------------------- #
 def load_meta_data():
     """
-    loads the meta-data contained in subjects_info.csv into a pandas.DataFrame.
+    loads the meta-data contained in subjects_info.csv into a pandas.DataFrame. The file is only parsed once for each
+    version of the file (absolute path and modification time), subsequent calls return a copy of the cached DataFrame.
     :return: DataFrame containing the meta-data
     """
 
-    return pd.read_csv('subjects_info.csv', sep=';', encoding='utf-8', index_col='subject_id')
+    # get the absolute path of the file (relative to the working directory) and its modification time
+    meta_data_path = os.path.abspath(META_DATA_FILENAME)
+
+    # return a copy, so that changes made by the caller do not affect the cached DataFrame
+    return _read_meta_data(meta_data_path, os.path.getmtime(meta_data_path)).copy()
 
 
 def get_muscleban_side(meta_data_df, mac_address):
@@ -37,16 +53,12 @@ def get_muscleban_side(meta_data_df, mac_address):
     :param mac_address: str containing the mac address without the colons
     :return: str containing the muscleban side
     """
-    # Search in mBAN_left column
-    if mac_address in meta_data_df[MBAN_LEFT].values:
-        return MBAN_LEFT
-
-    # Search in mBAN_right column
-    elif mac_address in meta_data_df[MBAN_RIGHT].values:
-        return MBAN_RIGHT
+    # get the mapping from mac address to side (built from the given DataFrame, so that filtered or edited copies of
+    # the meta-data are also looked up correctly)
+    mban_side_map = _get_mban_side_map(meta_data_df)
 
-    # If not found
-    return None
+    # returns None if not found
+    return mban_side_map.get(mac_address)
 
 
 def get_expected_devices(meta_data_df, group: str, device_num: str) -> List[str]:
@@ -66,3 +78,32 @@ def get_expected_devices(meta_data_df, group: str, device_num: str) -> List[str]
     expected_devices.extend([mban_left, mban_right])
 
     return expected_devices
+
+
+# ------------------------------------------------------------------------------------------------------------------- #
+# private functions
+# ------------------------------------------------------------------------------------------------------------------- #
+@lru_cache(maxsize=4)
+def _read_meta_data(meta_data_path: str, modification_time: float) -> pd.DataFrame:
+    """
+    Reads subjects_info.csv into a pandas.DataFrame. The results are cached using the path of the file and its
+    modification time, so that the file is parsed again when it is edited or when a different file is used.
+    :param meta_data_path: the absolute path to subjects_info.csv
+    :param modification_time: the modification time of the file (only used as part of the cache key)
+    :return: DataFrame containing the meta-data
+    """
+
+    return pd.read_csv(meta_data_path, sep=';', encoding='utf-8', index_col='subject_id', engine='c')
+
+
+def _get_mban_side_map(meta_data_df: pd.DataFrame) -> Dict[str, str]:
+    """
+    Builds a dictionary mapping each muscleban mac address to its side (mBAN_left or mBAN_right).
+    :param meta_data_df: pd.DataFrame containing the subject meta-data contained in subjects_info.csv
+    :return: dictionary with the mac addresses (without the colons) as keys and the muscleban side as values
+    """
+    # add the right side first so that the left side takes precedence if a mac address appears in both columns
+    mban_side_map = {mac_address: MBAN_RIGHT for mac_address in meta_data_df[MBAN_RIGHT].dropna()}
+    mban_side_map.update({mac_address: MBAN_LEFT for mac_address in meta_data_df[MBAN_LEFT].dropna()})
+
+    return mban_side_map
@@ -56,20 +56,23 @@ def get_file_paths_by_device(folder_path: Union[str, os.PathLike]) -> Dict[str,
     paths_dict = {}
 
     try:
-        # list the files in folder_path
-        files = os.listdir(folder_path)
+        # list the files in folder_path (the directory entries are read in one go and hold the path of each file)
+        with os.scandir(folder_path) as entries:
+            files = list(entries)
     except FileNotFoundError:
 
         # raise error in case the folder path is invalid
         raise ValueError(f"The folder at path {folder_path} was not found.")
 
     # iterate through the files inside the folder
-    for filename in files:
+    for entry in files:
 
         # If less than 1 kb than it's either empty or only has the header - ignore
-        if os.path.getsize(os.path.join(folder_path, filename)) <= MIN_BYTES:
+        if entry.stat().st_size <= MIN_BYTES:
             continue
 
+        filename = entry.name
+
         # check the device based on the filename
         device = extract_device_from_filename(filename)
 
@@ -32,7 +32,7 @@ import math
 
 # internal imports
 from load.parser import get_file_paths_by_device, extract_sensor_from_filename
-from .interpolate import cubic_spline_interpolation, slerp_interpolation, zero_order_hold_interpolation, \
+from .interpolate import cubic_spline_interpolation_bundle, slerp_interpolation, zero_order_hold_interpolation, \
     interpolate_heart_rate_sensor, resample_signals
 from constants import ROT, IMU_SENSORS, PHONE, WATCH, NOISE, HEART, TIME_COLUMN_NAME, VALID_MBAN_DATA, FS_MBAN
 
@@ -403,9 +403,16 @@ def _re_sample_data(sensor_data: List[pd.DataFrame], report:  Dict[str, Any], fs
     # list to hold the re-sampled data
     re_sampled_data = []
 
+    # get the positions of the IMU sensors (ACC, GYR, MAG)
+    imu_indices = [num for num, sensor_name in enumerate(report[LOADED_SENSORS]) if sensor_name in IMU_SENSORS]
+
+    # perform cubic spline interpolation for all IMU sensors at once (sensors sharing a time axis share the spline)
+    interpolated_imu_data = dict(zip(imu_indices,
+                                     cubic_spline_interpolation_bundle([sensor_data[num] for num in imu_indices], fs=fs)))
+
     # cycle over the sensors
-    for sensor_df, sensor_name in tqdm(zip(sensor_data, report[LOADED_SENSORS]), total=len(sensor_data),
-                                       desc=f"Ensuring equidistant sampling by resampling data to {fs} Hz"):
+    for num, (sensor_df, sensor_name) in tqdm(enumerate(zip(sensor_data, report[LOADED_SENSORS])), total=len(sensor_data),
+                                              desc=f"Ensuring equidistant sampling by resampling data to {fs} Hz"):
 
         # DataFrame for holding the interpolated data
         interpolated_sensor_df = pd.DataFrame()
@@ -413,8 +420,8 @@ def _re_sample_data(sensor_data: List[pd.DataFrame], report:  Dict[str, Any], fs
         # interpolation for IMU (ACC, GYR, MAG)
         if sensor_name in IMU_SENSORS:
 
-            # perform cubic spline interpolation
-            interpolated_sensor_df = cubic_spline_interpolation(sensor_df, fs=fs)
+            # get the cubic spline interpolation
+            interpolated_sensor_df = interpolated_imu_data[num]
 
         # interpolation for rotation vector (ROT)
         elif sensor_name == ROT:
@@ -3,7 +3,6 @@
 # ------------------------------------------------------------------------------------------------------------------- #
 import load
 import os
-from visualize.visualize_acquisitions import visualize_daily_acquisitions, visualize_group_acquisitions
 
 # ------------------------------------------------------------------------------------------------------------------- #
 # constants
@@ -20,6 +19,11 @@ DATE = "2022-07-04"
 
 if __name__ == '__main__':
 
+    # the visualize module (and matplotlib) is only imported when a visualization is requested
+    if VISUALIZE_DAY or VISUALIZE_GROUP:
+
+        from visualize.visualize_acquisitions import visualize_daily_acquisitions, visualize_group_acquisitions
+
     # visualize the acquisitions of a single day
     if VISUALIZE_DAY:
 
@@ -0,0 +1,82 @@
+"""
+Tests for the equidistant time axis and the interpolation functions in load/interpolate.py.
+"""
+
+# ------------------------------------------------------------------------------------------------------------------- #
+# imports
+# ------------------------------------------------------------------------------------------------------------------- #
+import numpy as np
+import pandas as pd
+import pytest
+
+# internal imports
+from load.interpolate import slerp_interpolation, _generate_new_time_axis, _get_num_new_samples, _slerp
+
+
+# ------------------------------------------------------------------------------------------------------------------- #
+# time axis
+# ------------------------------------------------------------------------------------------------------------------- #
+@pytest.mark.parametrize("start, stop, fs, expected", [
+    (0.0, 294.54, 100, 29454),  # span is an exact multiple of 1 / fs
+    (0.0, 0.3, 100, 30),
+    (1.7, 2.0, 10, 3),
+    (0.0, 294.545, 100, 29455),  # span is not a multiple of 1 / fs
+    (5.0, 5.0, 100, 0),
+])
+def test_num_new_samples_half_open(start, stop, fs, expected):
+
+    assert _get_num_new_samples(start, stop, fs) == expected
+
+
+def test_new_time_axis_excludes_stop_for_exact_multiples():
+
+    rng = np.random.default_rng(0)
+
+    for _ in range(20000):
+
+        # spans with ms resolution (as the android timestamps), many of them exact multiples of 1 / fs
+        start = round(rng.uniform(0, 5), 3)
+        stop = start + rng.integers(1, 400000) / 1000
+
+        time_axis_inter = _generate_new_time_axis(start, stop, 100)
+
+        # all samples within [start, stop) and no sample missing at the end
+        assert time_axis_inter[-1] < stop
+        assert start + time_axis_inter.size / 100 >= stop
+
+
+# ------------------------------------------------------------------------------------------------------------------- #
+# SLERP
+# ------------------------------------------------------------------------------------------------------------------- #
+def _random_unit_quaternions(num_samples: int, seed: int = 0) -> np.ndarray:
+
+    quaternions = np.random.default_rng(seed).normal(size=(num_samples, 4))
+
+    return quaternions / np.linalg.norm(quaternions, axis=1, keepdims=True)
+
+
+def test_slerp_accepts_last_timestamp():
+
+    time_axis = np.array([0.0, 0.5, 1.0, 1.5])
+    quaternions = _random_unit_quaternions(time_axis.size)
+
+    interpolated = _slerp(time_axis, quaternions, np.array([0.0, 0.25, 1.5]))
+
+    # the knots are reproduced (up to the sign of the quaternion) - including the last one
+    for interpolated_quaternion, quaternion in zip(interpolated[[0, 2]], quaternions[[0, 3]]):
+        assert np.isclose(abs(np.dot(interpolated_quaternion, quaternion)), 1.0)
+
+
+def test_slerp_interpolation_exact_multiple_span():
+
+    fs = 100
+
+    # 294.54 s recording (an exact multiple of 1 / fs) with android timestamps in nanoseconds
+    time_axis_ns = np.linspace(0, 294_540_000_000, 5000).astype(np.int64)
+    rotvec_df = pd.DataFrame(np.column_stack((time_axis_ns, _random_unit_quaternions(time_axis_ns.size))),
+                             columns=['t', 'x', 'y', 'z', 'w'])
+
+    interpolated_df = slerp_interpolation(rotvec_df, fs=fs)
+
+    assert len(interpolated_df) == 29454
+    assert np.allclose(np.linalg.norm(interpolated_df.iloc[:, 1:].to_numpy(), axis=1), 1.0)
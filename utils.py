@@ -10,10 +10,13 @@ extract_group_from_path(...): Extract the group number (e.g., "1", "2", "3") fro
 extract_date_from_path(...): Extract the date string (YYYY-MM-DD) from a folder path.
 get_most_common_acquisition_times(...): Find the four most common acquisition times for a subject by scanning folder names and filtering device data.
 get_most_common_times(...): Compute the most common acquisition times from a list, with optional adjustment to merge times closer than 20 minutes.
+time_string_to_seconds(...): Convert a time string (HH-MM-SS) to the number of seconds since midnight.
+time_string_to_datetime(...): Convert a time string (HH-MM-SS) to a datetime object without using datetime.strptime.
+seconds_to_time_string(...): Convert a number of seconds since midnight to a time string (HH-MM-SS).
 -------------------
 
 [Private]
-_remove_dates(...): Remove date folder names from a folder list, keeping only acquisition time folders.
+_scan_folders(...): Scan a folder and all its sub-folders (top-down) using os.scandir.
 _adjust_most_common_times(...): Filter out acquisition times that are too close (< 20 minutes apart), keeping the most frequent ones.
 -------------------
 """
@@ -21,7 +24,7 @@ _adjust_most_common_times(...): Filter out acquisition times that are too close
 # ------------------------------------------------------------------------------------------------------------------- #
 # imports
 # ------------------------------------------------------------------------------------------------------------------- #
-from typing import Optional, List
+from typing import Optional, List, Iterator, Tuple
 import re
 import os
 from collections import Counter
@@ -29,6 +32,14 @@ from datetime import datetime
 
 #internal imports
 from constants import ANDROID, ANDROID_WEAR
+
+# ------------------------------------------------------------------------------------------------------------------- #
+# file specific constants
+# ------------------------------------------------------------------------------------------------------------------- #
+# regular expressions (compiled once at import)
+DEVICE_NUM_PATTERN = re.compile(r'LIBPhys (#\d+)')
+GROUP_PATTERN = re.compile(r'group(\d+)')
+DATE_PATTERN = re.compile(r'\b(\d{4}-\d{2}-\d{2})\b')
 # ------------------------------------------------------------------------------------------------------------------- #
 # public functions
 # ------------------------------------------------------------------------------------------------------------------- #
@@ -55,7 +66,7 @@ def create_dir(path, folder_name):
 def extract_device_num_from_path(folder_path: str) -> Optional[str]:
     # returns #001
     # folder name starts with 'group' (i.e.: group1, group2, group3...)
-    if match := re.search(r'LIBPhys (#\d+)', folder_path):
+    if match := DEVICE_NUM_PATTERN.search(folder_path):
 
         return match.group(1)
 
@@ -71,7 +82,7 @@ def extract_group_from_path(folder_path: str) -> Optional[str]:
     """
 
     # find the group in the folder path (group1, group2, group3 ...)
-    if match := re.search(r'group(\d+)', folder_path):
+    if match := GROUP_PATTERN.search(folder_path):
 
         return match.group(1)
 
@@ -87,7 +98,7 @@ def extract_date_from_path(folder_path: str) -> Optional[str]:
     """
 
     # find the group in the folder path (group1, group2, group3 ...)
-    if match := re.search(r'\b(\d{4}-\d{2}-\d{2})\b', folder_path):
+    if match := DATE_PATTERN.search(folder_path):
 
         return match.group(1)
 
@@ -110,39 +121,56 @@ def get_most_common_acquisition_times(data_path: str) -> List[datetime]:
     # check for group 1
     if 'group1' in data_path:
 
-        for _, dirs, files in os.walk(data_path):
+        for _, dirs, files in _scan_folders(data_path):
             acquisition_times_list.extend(dirs)
     else:
 
         # get all folder names within data path
-        for root, _, files in os.walk(data_path):
+        for root, _, files in _scan_folders(data_path):
 
             # check if any file contains '_ANDROID_WEAR_' and if no file contains '_ANDROID_' without '_WEAR_'
             # this is done to filter out the folders that contain the phone data
-            contains_android_wear = any(ANDROID_WEAR in filename for filename in files)
-            contains_android_only = any(ANDROID in filename and ANDROID_WEAR not in filename for filename in files)
+            contains_android_wear = contains_android_only = False
+            for filename in files:
+
+                if ANDROID_WEAR in filename:
+                    contains_android_wear = True
+
+                elif ANDROID in filename:
+                    contains_android_only = True
+
+                # both found, no need to check the remaining files
+                if contains_android_wear and contains_android_only:
+                    break
 
             # filter for folders that contain EMG data (excluding folders that contain the phone data)
             if contains_android_wear and not contains_android_only:
                 acquisition_times_list.append(os.path.basename(root))
 
-    # remove all folder names that are not times (in the database structure there are date and time folders only)
-    acquisition_times_list = _remove_dates(acquisition_times_list)
+    # count the acquisition times in a single pass
+    time_count = Counter()
+    for folder_name in acquisition_times_list:
+
+        # skip all folder names that are not times (in the database structure there are date and time folders only)
+        # times are HH-MM-SS (8 characters with dashes at [2] and [5]), dates are YYYY-MM-DD
+        if len(folder_name) == 8 and folder_name[2] == '-' and folder_name[5] == '-' \
+                and (folder_name[:2] + folder_name[3:5] + folder_name[6:]).isdigit():
 
-    # standardize the times (replacing seconds with 00)
-    acquisition_times_list = [time[:-2] + '00' for time in acquisition_times_list]
+            # standardize the time (replacing seconds with 00)
+            time_count[folder_name[:-2] + '00'] += 1
 
     # find the most common times (usually 4 due to four acquisitions a day, but could also be less)
-    acquisition_times_list = get_most_common_times(acquisition_times_list, adjust_close_times=True)
+    acquisition_times_list = get_most_common_times(time_count, adjust_close_times=True)
 
-    return [datetime.strptime(time, "%H-%M-%S") for time in acquisition_times_list]
+    return [time_string_to_datetime(time) for time in acquisition_times_list]
 
 
 def get_most_common_times(acquisition_times_list, adjust_close_times=False):
     """
     gets the most common acquisition times. In case there are > 4 unique times the four most common times are return,
     otherwise just the unique acquisition times are returned.
-    :param acquisition_times_list:
+    :param acquisition_times_list: list containing the acquisition times, or a Counter with the times as keys and their
+                                   occurrences as values
     :param adjust_close_times: boolean flag for adjusting times that are closer than 20 min to each other. When this
                                flag is set to True, the times in acquisition_times_list are adjusted in the following
                                way.
@@ -152,78 +180,148 @@ def get_most_common_times(acquisition_times_list, adjust_close_times=False):
     :return: list containing the four most common times within the passed acquisition_times_list
     """
 
+    # get the unique times (built only once)
+    unique_times = set(acquisition_times_list)
+
     # check if the number of unique times is less than 4
-    if len(set(acquisition_times_list)) <= 4:
+    if len(unique_times) <= 4:
 
         # get the unique times sorted
-        most_common_times = sorted(list(set(acquisition_times_list)))
+        most_common_times = sorted(unique_times)
 
     else:
 
-        # count the occurrences
-        time_count = Counter(acquisition_times_list)
+        # count the occurrences (only if they have not been counted yet)
+        time_count = acquisition_times_list if isinstance(acquisition_times_list, Counter) \
+            else Counter(acquisition_times_list)
 
+        # get the four most common times
         if adjust_close_times:
-            time_count = _adjust_most_common_times(time_count)
 
-        # get the four most common times
-        most_common = time_count.most_common(4)
+            # the adjusted times are already sorted by occurrences
+            most_common = _adjust_most_common_times(time_count)[:4]
+
+        else:
+            most_common = time_count.most_common(4)
 
         # Extract the times in ascending order if there's a tie
-        most_common_times = sorted([time[0] for time in most_common])
+        most_common_times = sorted(time for time, _ in most_common)
 
     return most_common_times
 
 
+def time_string_to_seconds(time_str: str) -> int:
+    """
+    Converts a time string in the format HH-MM-SS (or HH:MM:SS) to the number of seconds since midnight. The string
+    is parsed by slicing, which is considerably faster than datetime.strptime.
+    :param time_str: the time string (e.g., '10-30-00')
+    :return: the number of seconds since midnight (e.g., 37800)
+    """
+
+    return int(time_str[:2]) * 3600 + int(time_str[3:5]) * 60 + int(time_str[6:8])
+
+
+def time_string_to_datetime(time_str: str) -> datetime:
+    """
+    Converts a time string in the format HH-MM-SS (or HH:MM:SS) to a datetime object (on 1900-01-01, as returned by
+    datetime.strptime). The string is parsed by slicing and the datetime is built directly from the parsed fields.
+    :param time_str: the time string (e.g., '10-30-00')
+    :return: datetime object containing the time (e.g., datetime(1900, 1, 1, 10, 30, 0))
+    """
+
+    return datetime(1900, 1, 1, int(time_str[:2]), int(time_str[3:5]), int(time_str[6:8]))
+
+
+def seconds_to_time_string(seconds: int, separator: str = '-') -> str:
+    """
+    Converts a number of seconds since midnight to a time string in the format HH-MM-SS.
+    :param seconds: the number of seconds since midnight (e.g., 37800)
+    :param separator: the separator between hours, minutes, and seconds. Default: '-'
+    :return: the time string (e.g., '10-30-00')
+    """
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+
+    return f"{hours:02d}{separator}{minutes:02d}{separator}{seconds:02d}"
+
+
 # ------------------------------------------------------------------------------------------------------------------- #
 # private functions
 # ------------------------------------------------------------------------------------------------------------------- #
-def _remove_dates(folder_list):
+def _scan_folders(folder_path: str) -> Iterator[Tuple[str, List[str], List[str]]]:
     """
-    removes date folder names from the folder_list, thus only time folder names are kept.
-    :param folder_list: a list containing all sub-folder names for a subject in the database
-    :return: list with only acquisition time folder names
+    Scans folder_path and all its sub-folders (top-down) using os.scandir. The directory entries are used to tell folders
+    and files apart (no extra stat call per entry) and the sub-folder paths are taken directly from the entries. As in
+    os.walk, folders that cannot be read are skipped.
+    :param folder_path: the path to the folder that should be scanned
+    :return: generator yielding, for each folder, a tuple containing the folder path, the names of its sub-folders, and
+             the names of its files
     """
-    # Regular expression to match date patterns (HH-MM-SS)
-    date_pattern = re.compile(r'\d{2}-\d{2}-\d{2}')
+    # stack with the folders that still have to be scanned
+    folders_to_scan = [folder_path]
+
+    while folders_to_scan:
 
-    # Filter out strings that don't match the date pattern
-    result = [item for item in folder_list if re.match(date_pattern, item)]
+        current_folder = folders_to_scan.pop()
 
-    return result
+        # lists for holding the names of the sub-folders and files, and the sub-folder paths
+        subfolder_names, filenames, subfolder_paths = [], [], []
+
+        # folders that cannot be read (e.g., removed or without permissions) are skipped silently (as in os.walk)
+        try:
+            with os.scandir(current_folder) as entries:
+
+                for entry in entries:
+
+                    if entry.is_dir():
+                        subfolder_names.append(entry.name)
+
+                        # symbolic links to folders are listed but not followed (as in os.walk)
+                        if not entry.is_symlink():
+                            subfolder_paths.append(entry.path)
+
+                    else:
+                        filenames.append(entry.name)
+
+        except OSError:
+            continue
+
+        yield current_folder, subfolder_names, filenames
+
+        # add the sub-folders in reverse so that they are scanned in the order they were listed
+        folders_to_scan.extend(reversed(subfolder_paths))
 
 
 def _adjust_most_common_times(counter):
     """
     Filter times that are too close to each other, keeping only those at least 20 minutes apart.
     :param counter: Counter object with times as keys and occurrences as values.
-    :return: Counter object with filtered times.
+    :return: list of (time, count) tuples with the filtered times, sorted by occurrences (desc) and then by time (asc).
     """
 
-    # Convert time strings to datetime objects and sort by occurrences and then by time
-    times = [(datetime.strptime(time, '%H-%M-%S'), time, count) for time, count in counter.items()]
-    times.sort(key=lambda x: (-x[2], x[0]))  # Sort by occurrences (desc) and then by time (asc)
+    # Convert time strings to seconds (since midnight) and sort by occurrences (desc) and then by time (asc)
+    # (the negated count is stored in the tuple, so the plain tuple comparison can be used instead of a key function)
+    times = [(-count, time_string_to_seconds(time), time) for time, count in counter.items()]
+    times.sort()
 
     # List to keep the filtered times
     filtered_times = []
 
     # Iterate and filter times
-    for i in range(len(times)):
+    for current_time in times:
 
-        current_time, current_time_str, current_count = times[i]
+        current_seconds = current_time[1]
 
         # Check if the current time is too close to any already accepted time
         too_close = False
-        for filtered_time, _, _ in filtered_times:
-            if abs((current_time - filtered_time).total_seconds()) < 20 * 60:
+        for _, filtered_seconds, _ in filtered_times:
+            if abs(current_seconds - filtered_seconds) < 20 * 60:
                 too_close = True
                 break
 
         # If not too close, add to filtered times
         if not too_close:
-            filtered_times.append(times[i])
-
-    # Convert back to Counter
-    result_counter = Counter({time_str: count for _, time_str, count in filtered_times})
+            filtered_times.append(current_time)
 
-    return result_counter
+    # return the (time, count) pairs - already sorted by occurrences (desc) and then by time (asc)
+    return [(time_str, -neg_count) for neg_count, _, time_str in filtered_times]
@@ -15,22 +15,29 @@ class RefLine:
 
 # Custom handler to draw horizontal line with vertical ticks (|-|)
 class HandlerRefLine(HandlerBase):
+
+    # line style shared by the three line segments
+    COLOR = "#26373C"
+    LINE_WIDTH = 2
+    TICK_HEIGHT_RATIO = 0.3  # vertical tick height (relative to the legend entry height)
+
     def create_artists(self, legend, orig_handle,
                        xdescent, ydescent, width, height, fontsize, trans):
         y = height / 2.0
-        tick_height = height * 0.3   # vertical tick height
-        lw = 2
+        half_tick = height * self.TICK_HEIGHT_RATIO / 2
+
+        # x-coordinates of the line ends and y-coordinates of the ticks
+        x_start, x_end = xdescent, xdescent + width
+        y_tick = [y - half_tick, y + half_tick]
+
+        # common line properties
+        line_kwargs = dict(color=self.COLOR, lw=self.LINE_WIDTH, transform=trans)
 
         # Horizontal line
-        line = Line2D([xdescent, xdescent + width],
-                      [y, y], color="#26373C", lw=lw, transform=trans)
+        line = Line2D([x_start, x_end], [y, y], **line_kwargs)
 
         # Vertical ticks at ends
-        left_tick = Line2D([xdescent, xdescent],
-                           [y - tick_height/2, y + tick_height/2],
-                           color="#26373C", lw=lw, transform=trans)
-        right_tick = Line2D([xdescent + width, xdescent + width],
-                            [y - tick_height/2, y + tick_height/2],
-                            color="#26373C", lw=lw, transform=trans)
-
-        return [line, left_tick, right_tick]
\ No newline at end of file
+        left_tick = Line2D([x_start, x_start], y_tick, **line_kwargs)
+        right_tick = Line2D([x_end, x_end], y_tick, **line_kwargs)
+
+        return [line, left_tick, right_tick]
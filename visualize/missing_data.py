@@ -11,25 +11,28 @@ get_missing_data(...): Identify missing acquisition times and durations for each
 _has_close_time(...): Check whether a given timestamp is within the tolerance window of another timestamp in a list.
 _get_missing_timestamps(...): Compare expected acquisition times with actual ones to determine which are missing.
 _find_unique_timestamps(...): Extract unique acquisition timestamps across devices (excluding phone), accounting for tolerance in start times.
+_get_average_acquisition_times(...): Get the most common acquisition times of a subject in seconds since midnight (cached per subject folder version).
+_get_subject_folder_mtime(...): Get the latest modification time of a subject folder and of its daily folders.
 -------------------
 """
 
 # ------------------------------------------------------------------------------------------------------------------- #
 # imports
 # ------------------------------------------------------------------------------------------------------------------- #
-from typing import Dict, List
-from datetime import datetime
+import os
+from typing import Dict, List, Optional, Tuple
+from bisect import bisect_left
+from functools import lru_cache
 
 # internal imports
 from constants import PHONE, ACQUISITION_TIME_SECONDS
-from utils import get_most_common_acquisition_times
+from utils import get_most_common_acquisition_times, time_string_to_seconds, seconds_to_time_string
 
 # ------------------------------------------------------------------------------------------------------------------- #
 # file specific constants
 # ------------------------------------------------------------------------------------------------------------------- #
 LENGTH = 'length'
 START_TIMES = 'start_times'
-TIME_FORMAT = "%H-%M-%S"
 # ------------------------------------------------------------------------------------------------------------------- #
 # public functions
 # ------------------------------------------------------------------------------------------------------------------- #
@@ -80,6 +83,10 @@ def get_missing_data(subject_folder_path: str, acquisitions_dict: Dict[str, Dict
     # dictionary to store the missing data with the same format as the dictionary storing the actual acquisitions
     missing_data_dict: Dict[str, Dict[str, list]] = {}
 
+    # the unique timestamps of the devices that should acquire at the same time
+    # (only computed when the first device with missing acquisitions is found, as they do not depend on the device)
+    unique_timestamps_list: Optional[List[int]] = None
+
     # check if there are missing acquisitions
     for device, data in acquisitions_dict.items():
 
@@ -91,7 +98,8 @@ def get_missing_data(subject_folder_path: str, acquisitions_dict: Dict[str, Dict
         if  len(data[START_TIMES]) < 4:
 
             # (1) get the unique timestamps - all timestamps of the devices that should acquire at the same time
-            unique_timestamps_list = _find_unique_timestamps(acquisitions_dict, tolerance_seconds)
+            if unique_timestamps_list is None:
+                unique_timestamps_list = _find_unique_timestamps(acquisitions_dict, tolerance_seconds)
 
             # (2) compare the actual timestamps with the unique to get missing timestamps for the device
             missing_times_list = _get_missing_timestamps(unique_timestamps_list, data[START_TIMES])
@@ -102,8 +110,10 @@ def get_missing_data(subject_folder_path: str, acquisitions_dict: Dict[str, Dict
                 # create list with the actual timestamps and the missing timestamps found in get_missing_time_from_device
                 temp_list = data[START_TIMES] + missing_times_list
 
-                # Get the most common expected acquisition based on the average of all days
-                average_times_list = get_most_common_acquisition_times(subject_folder_path)
+                # Get the most common expected acquisition based on the average of all days (only once per subject,
+                # unless acquisitions were added to or removed from the subject folder)
+                average_times_list = _get_average_acquisition_times(subject_folder_path,
+                                                                    _get_subject_folder_mtime(subject_folder_path))
 
                 # use the averages to get only the timestamps that are missing on both devices
                 missing_times_list.extend(_get_missing_timestamps(average_times_list, temp_list))
@@ -131,22 +141,31 @@ def get_missing_data(subject_folder_path: str, acquisitions_dict: Dict[str, Dict
 # private functions
 # ------------------------------------------------------------------------------------------------------------------- #
 
-def _has_close_time(time: datetime, time_list_dt: List[datetime], tolerance_seconds: int) -> bool:
+def _has_close_time(time: int, time_list: List[int], tolerance_seconds: int) -> bool:
     """
-    Check whether a given timestamp is within the tolerance window of any timestamp in a list.
+    Check whether a given timestamp is within the tolerance window of any timestamp in a sorted list.
 
     This function is used to determine if an acquisition time is "close enough"
-    to another (i.e., represents the same scheduled acquisition).
+    to another (i.e., represents the same scheduled acquisition). Since the list is sorted, only the two
+    neighbours of the insertion point of `time` need to be checked.
 
-    :param time: A datetime object to compare.
-    :param time_list_dt: List of datetime objects representing existing acquisition times.
+    :param time: The time to compare (in seconds since midnight).
+    :param time_list: Sorted list of existing acquisition times (in seconds since midnight).
     :param tolerance_seconds: Time difference (in seconds) allowed for considering two times as the same.
-    :return: True if `time` is within the tolerance of any timestamp in `time_list_dt`, otherwise False.
+    :return: True if `time` is within the tolerance of any timestamp in `time_list`, otherwise False.
     """
-    return any(abs((time - t).total_seconds()) <= tolerance_seconds for t in time_list_dt)
+    # find where the time would be inserted in the sorted list
+    idx = bisect_left(time_list, time)
+
+    # check the closest time before
+    if idx > 0 and time - time_list[idx - 1] <= tolerance_seconds:
+        return True
+
+    # check the closest time after
+    return idx < len(time_list) and time_list[idx] - time <= tolerance_seconds
 
 
-def _get_missing_timestamps(unique_timestamps_list: List[datetime], acquisitions_times_list: List[str],
+def _get_missing_timestamps(unique_timestamps_list: List[int], acquisitions_times_list: List[str],
                             tolerance_seconds=600) -> List[str]:
     """
     Identify which expected acquisition times are missing for a device.
@@ -154,31 +173,31 @@ def _get_missing_timestamps(unique_timestamps_list: List[datetime], acquisitions
     This function compares the unique expected acquisition times (found with the devices that acquired data) against the actual
     acquisition times recorded by a device (that had missing acquisitions), and returns those that are missing.
 
-    :param unique_timestamps_list: List of datetime objects representing all expected acquisitions.
+    :param unique_timestamps_list: List of all expected acquisition times (in seconds since midnight).
     :param acquisitions_times_list: List of acquisition start times (string format) for the device.
     :param tolerance_seconds: Allowed deviation (in seconds) for considering times as equal. Default = 600.
-    :return: List of missing acquisition times (string format, TIME_FORMAT).
+    :return: List of missing acquisition times (string format, HH-MM-SS).
     """
 
     # innit list to store the missing times
     missing_times: List[str] = []
 
-    # change the sensor start times to datetime
-    device_timestamp_dt = [datetime.strptime(timestamp, TIME_FORMAT) for timestamp in acquisitions_times_list]
+    # change the sensor start times to seconds since midnight (sorted for the bisection search)
+    device_timestamps = sorted(time_string_to_seconds(timestamp) for timestamp in acquisitions_times_list)
 
     # iterate through the unique timestamps
     for timestamp in unique_timestamps_list:
 
         # check if there is a timestamp that is NOT similar to the one in unique_timestamps_list
-        if not _has_close_time(timestamp,device_timestamp_dt, tolerance_seconds):
+        if not _has_close_time(timestamp, device_timestamps, tolerance_seconds):
 
             # add to the list with missing times in the correct format
-            missing_times.append(timestamp.strftime(TIME_FORMAT))
+            missing_times.append(seconds_to_time_string(timestamp))
 
     return missing_times
 
 
-def _find_unique_timestamps(acquisitions_dict: Dict[str, Dict[str, list]], tolerance_seconds: int) -> List[datetime]:
+def _find_unique_timestamps(acquisitions_dict: Dict[str, Dict[str, list]], tolerance_seconds: int) -> List[int]:
     """
     Finds a set of start times that are expected for all devices, except the smartphone. this is done by getting the
     unique timestamps for all three devices (watch, mBAN right, and mBAN left), with a tolerance, since the devices don't start
@@ -187,11 +206,11 @@ def _find_unique_timestamps(acquisitions_dict: Dict[str, Dict[str, list]], toler
     :param acquisitions_dict: Dictionary with device acquisition data.
                               Each entry contains 'start_times' and 'length'.
     :param tolerance_seconds: Allowed deviation (in seconds) for considering timestamps as the same acquisition.
-    :return: A list of unique acquisition times (datetime objects).
+    :return: A list of unique acquisition times (in seconds since midnight).
     """
 
     # list for holding all timestamps found for the 3 devices that acquire at the same time
-    all_daily_timestamps: List[datetime] = []
+    all_daily_timestamps: List[int] = []
 
     for device, data in acquisitions_dict.items():
 
@@ -199,26 +218,57 @@ def _find_unique_timestamps(acquisitions_dict: Dict[str, Dict[str, list]], toler
         if device == PHONE:
             continue
 
-        # change to datetime objects to perform mathematics
-        acquisition_times_dt = [datetime.strptime(time, TIME_FORMAT) for time in data[START_TIMES]]
-        all_daily_timestamps.extend(acquisition_times_dt)
+        # change to seconds since midnight to perform mathematics
+        all_daily_timestamps.extend(time_string_to_seconds(time) for time in data[START_TIMES])
 
     # since these devices don't start exactly at the same time, remove the timestamps that are very similar based on tolerance_seconds
     # list for holding the unique timestamps
-    filtered_timestamps: List[datetime] = []
+    filtered_timestamps: List[int] = []
 
     # iterate through the sorted list
     for timestamp in sorted(all_daily_timestamps):
 
-        # if list is empty add the first timestamp
-        if not filtered_timestamps:
-
+        # check if this timestamp is similar to the previous value add only if it's not (or if the list is empty)
+        # since the list is sorted, the previous value is the closest of the filtered timestamps
+        if not filtered_timestamps or timestamp - filtered_timestamps[-1] > tolerance_seconds:
             filtered_timestamps.append(timestamp)
 
-        else:
-            # check if this timestamp is similar to the previous value add only if it's not
-            if not _has_close_time(timestamp, filtered_timestamps, tolerance_seconds):
-                filtered_timestamps.append(timestamp)
 
+    return filtered_timestamps
+
+
+@lru_cache(maxsize=128)
+def _get_average_acquisition_times(subject_folder_path: str, folder_mtime: float) -> Tuple[int, ...]:
+    """
+    Gets the most common acquisition times of the subject (based on all days of acquisition) in seconds since midnight.
+    The results are cached per subject folder and its modification time, since finding them requires scanning the whole
+    subject folder and they are needed for every day of the subject.
+
+    :param subject_folder_path: Path to the folder containing all data from the subject
+    :param folder_mtime: Latest modification time of the subject folder and its daily folders (only used as part of
+                         the cache key).
+    :return: A tuple with the most common acquisition times (in seconds since midnight).
+    """
+    return tuple(time.hour * 3600 + time.minute * 60 + time.second
+                 for time in get_most_common_acquisition_times(subject_folder_path))
+
+
+def _get_subject_folder_mtime(subject_folder_path: str) -> float:
+    """
+    Gets the latest modification time of a subject folder and of its daily folders. Adding or removing a day or an
+    acquisition folder updates these modification times, so they identify the version of the subject folder without
+    scanning all acquisition files.
+
+    :param subject_folder_path: Path to the folder containing all data from the subject
+    :return: The latest modification time (in seconds since the epoch).
+    """
+    latest_mtime = os.stat(subject_folder_path).st_mtime
+
+    with os.scandir(subject_folder_path) as entries:
+
+        for entry in entries:
+
+            if entry.is_dir():
+                latest_mtime = max(latest_mtime, entry.stat().st_mtime)
 
-    return filtered_timestamps
\ No newline at end of file
+    return latest_mtime
@@ -21,6 +21,11 @@ import re
 # internal imports
 import load
 
+# ------------------------------------------------------------------------------------------------------------------- #
+# file specific constants
+# ------------------------------------------------------------------------------------------------------------------- #
+# timestamp at the end of the filename - format is hh-mm-ss (compiled once at import)
+FILENAME_TIMESTAMP_PATTERN = re.compile(r'_(\d{2}-\d{2}-\d{2})(?:\.\w+)?$')
 
 # ------------------------------------------------------------------------------------------------------------------- #
 # public functions
@@ -43,16 +48,22 @@ def get_device_filename_timestamp(folder_path: str) -> Dict[str, str]:
     # innit dictionary to store the results
     start_times_dict: Dict[str, str] = {}
 
-    for filename in os.listdir(folder_path):
+    with os.scandir(folder_path) as entries:
+
+        for entry in entries:
+
+            # skip sub-folders (the directory entry already holds the type, no extra stat call needed)
+            if entry.is_dir(follow_symlinks=False):
+                continue
 
-        # extract device from filename
-        device_name = load.extract_device_from_filename(filename)
+            # extract device from filename
+            device_name = load.extract_device_from_filename(entry.name)
 
-        # extract timestamp from filename
-        device_timestamp = _extract_timestamp_from_filename(filename)
+            # extract timestamp from filename
+            device_timestamp = _extract_timestamp_from_filename(entry.name)
 
-        # update dictionary
-        start_times_dict[device_name] = device_timestamp
+            # update dictionary
+            start_times_dict[device_name] = device_timestamp
 
     return start_times_dict
 
@@ -73,7 +84,7 @@ def _extract_timestamp_from_filename(filename: str) -> str:
     :return: The timestamp in the 'hh:mm:ss.000' format
     """
     # Regex to extract the timestamp from filename - format is hh-mm-ss
-    match = re.search(r'_(\d{2}-\d{2}-\d{2})(?:\.\w+)?$', filename)
+    match = FILENAME_TIMESTAMP_PATTERN.search(filename)
 
     if not match:
         raise ValueError(f"No valid time found in filename: {filename}")
@@ -11,13 +11,21 @@ visualize_daily_acquisitions(...): Plot acquisitions for a subject on a given da
 
 [Private]
 _get_daily_acquisitions_metadata(...): Aggregate acquisition lengths and start times for all devices on a given day.
+_get_acquisition_info(...): Get the signal length and start time of each device for a single acquisition folder.
+_is_plot_up_to_date(...): Check if the plot of a day already exists and is newer than all acquisition files.
+_get_latest_modification_time(...): Get the latest modification time of a folder and of everything inside it.
+_load_signal_lengths(...): Load the signals of an acquisition folder and return their lengths (cached per folder version).
 _calculate_df_length(...): Compute the number of rows in each DataFrame of signals.
-_check_logger_file(...): Verify if a logger file exists (and is non-empty) in a given folder.
 _normalize_device_names(...): Translate raw device names into human-readable labels (Portuguese).
 _get_day_string(...): Convert a date string into weekday and formatted date string in the specified locale.
+_set_time_locale(...): Set the locale used for formatting dates (only once per process).
 _add_missing_device(...): Add a device missing for the entire day into the missing-data dictionary using a reference device.
 _get_acquisition_time_range(...): Determine earliest and latest acquisition times across devices.
-_plot_device_bars(...): Draw horizontal bars for each device’s acquisitions or missing data on a timeline.
+_start_time_to_datetime(...): Convert an acquisition start time (HH-MM-SS) into a datetime object (cached).
+_start_time_to_date_num(...): Convert an acquisition start time (HH-MM-SS) into a matplotlib date number (cached).
+_get_device_y_positions(...): Compute the vertical positions (bottom, center, and top) of the bar of each device.
+_get_device_bars(...): Get the horizontal bars for each device’s acquisitions or missing data on a timeline.
+_plot_bars(...): Draw all horizontal bars of the plot in a single collection.
 _plot_reference_acquisition(...): Plot a reference duration line (e.g., 20 min) on top of acquisitions.
 _plot_device_labels_and_guides(...): Plot device labels and dashed guidelines for visual clarity.
 -------------------
@@ -27,29 +35,32 @@ _plot_device_labels_and_guides(...): Plot device labels and dashed guidelines fo
 # imports
 # ------------------------------------------------------------------------------------------------------------------- #
 import os
-import glob
 import pandas as pd
-from typing import Dict, Any, Optional, Tuple, Union, Callable
+from typing import Dict, Any, Optional, Tuple, Union, Callable, List
 from datetime import datetime, timedelta
 import matplotlib.pyplot as plt
 from matplotlib.axes import Axes
-from matplotlib.dates import DateFormatter
+from matplotlib.dates import DateFormatter, date2num
 from matplotlib.patches import Patch
+from matplotlib.collections import PolyCollection
+import numpy as np
 import re
 import locale
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # internal imports
 import load
-from constants import ACQUISITION_TIME_SECONDS, MBAN_RIGHT
+from constants import ACQUISITION_TIME_SECONDS, MBAN_RIGHT, PHONE, WATCH
 from .parser import get_device_filename_timestamp
-from utils import extract_device_num_from_path, extract_group_from_path, extract_date_from_path, create_dir
+from utils import extract_device_num_from_path, extract_group_from_path, extract_date_from_path, create_dir, \
+    time_string_to_datetime, time_string_to_seconds
 from .missing_data import get_missing_data
 from .legend_handlers import RefLine, HandlerRefLine
 
 # ------------------------------------------------------------------------------------------------------------------- #
 # file specific constants
 # ------------------------------------------------------------------------------------------------------------------- #
-LOGGER_FILENAME_PREFIX = 'opensignals_ACQUISITION_LOG_'
 LENGTH = 'length'
 START_TIMES = 'start_times'
 COLOR_PALLETE = ['#f2b36f', "#F07A15", '#4D92D0', '#3C787E']
@@ -61,6 +72,15 @@ MBAN_DIR = "mBAN dir"
 DEVICE_ORDER = [MBAN_ESQ, MBAN_DIR, SMARTWATCH,SMARTPHONE]
 REF_DEVICES = [SMARTWATCH, MBAN_DIR, MBAN_ESQ]
 SMART = 'Smart'
+ANDROID_DEVICES = (PHONE, WATCH)
+
+# day used as reference for the acquisition times (the same as datetime.strptime(...) uses for time-only strings)
+TIME_REFERENCE_DAY = datetime(1900, 1, 1)
+
+# muscleban mac address without the colons (12 numbers or upper case letters)
+MBAN_MAC_PATTERN = re.compile(r'[A-Z0-9]{12}')
+
+SECONDS_PER_DAY = 24 * 60 * 60
 
 VERTICAL_SPACING = 0.2
 BAR_HEIGHT = 0.1
@@ -68,29 +88,74 @@ BAR_HEIGHT = 0.1
 # public functions
 # ------------------------------------------------------------------------------------------------------------------- #
 
-def visualize_group_acquisitions(group_folder_path: str, fs=100) -> None:
+def visualize_group_acquisitions(group_folder_path: str, fs=100, overwrite: bool = True,
+                                 n_workers: Optional[int] = None) -> None:
     """
-    Generates a plot with the daily acquisitions for each device and for each subject of the group.
+    Generates a plot with the daily acquisitions for each device and for each subject of the group. By default, all plots
+    are generated again. When overwrite is False, the days whose plot already exists and is newer than all acquisition
+    files are skipped.
+
+    Since the days are independent of each other, the plots can be generated in parallel using a pool of processes
+    (processes instead of threads, as matplotlib is not thread-safe). By default, the plots are generated sequentially.
 
     :param group_folder_path: Path to the folder containing all subjects' data from the group
     :param fs: the sampling frequency (default = 100 Hz)
+    :param overwrite: boolean indicating whether up-to-date plots should be generated again (default = True)
+    :param n_workers: the number of processes used for generating the plots. If None or 1, the plots are generated
+                      sequentially in the current process. Default: None
     :return: None
     """
-    # iterate through the subjects in the group
-    for subject_folder in os.listdir(group_folder_path):
+    # list for holding the (subject folder, date) of all days that should be plotted
+    daily_folders = []
+
+    # iterate through the subjects in the group (the directory entries already hold the full path and the type)
+    with os.scandir(group_folder_path) as subject_entries:
+
+        for subject_entry in subject_entries:
+
+            # skip anything that is not a subject folder
+            if not subject_entry.is_dir():
+                continue
+
+            # get path for the subject data
+            subject_folder_path = subject_entry.path
+
+            # iterate through the daily acquisitions
+            with os.scandir(subject_folder_path) as daily_entries:
+
+                for daily_entry in daily_entries:
+
+                    # skip anything that is not a daily folder
+                    if not daily_entry.is_dir():
+                        continue
+
+                    daily_folders.append((subject_folder_path, daily_entry.name))
+
+    # plot visualizations for all acquisitions of the subjects sequentially
+    if n_workers is None or n_workers <= 1:
+
+        for subject_folder_path, date in daily_folders:
+            visualize_daily_acquisitions(subject_folder_path, date, fs=fs, overwrite=overwrite)
 
-        # get path for the subject data
-        subject_folder_path = os.path.join(group_folder_path, subject_folder)
+    # plot visualizations for all acquisitions of the subjects in parallel
+    # (the workers use the non-interactive Agg backend, as the plots are only saved to file)
+    else:
 
-        # iterate through the daily acquisitions
-        for daily_folder in os.listdir(subject_folder_path):
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=plt.switch_backend, initargs=('Agg',)) as executor:
 
-            # plot visualizations for all acquisitions of the subject
-            visualize_daily_acquisitions(subject_folder_path, daily_folder, fs=fs)
+            # each process loads its acquisitions sequentially (the default, so no thread pools are nested inside the
+            # process pool)
+            futures = [executor.submit(visualize_daily_acquisitions, subject_folder_path, date, fs=fs,
+                                       overwrite=overwrite)
+                       for subject_folder_path, date in daily_folders]
 
+            # wait for all plots (raises the exception of any plot that failed)
+            for future in futures:
+                future.result()
 
 
-def visualize_daily_acquisitions(subject_folder_path: str, date: str, fs=100) -> None:
+def visualize_daily_acquisitions(subject_folder_path: str, date: str, fs=100, overwrite: bool = True,
+                                 n_loading_threads: int = 1) -> None:
     """
     Visualizes daily signal acquisitions per subject as horizontal bars over a timeline, including missing acquisitions.
     The plot is saved as a PNG file.
@@ -98,11 +163,34 @@ def visualize_daily_acquisitions(subject_folder_path: str, date: str, fs=100) ->
     :param subject_folder_path: Path to the subject's folder.
     :param date: Date string (YYYY-MM-DD) of the acquisitions to visualize.
     :param fs: Sampling frequency (default 100 Hz).
+    :param overwrite: boolean indicating whether the plot should be generated again if it already exists and is newer
+                      than all acquisition files (default = True). When False, up-to-date plots are skipped without
+                      loading any data.
+    :param n_loading_threads: the maximum number of threads used for loading the acquisitions of the day. If 1, the
+                              acquisitions are loaded sequentially. Each thread holds the raw signals of one
+                              acquisition in memory, so the peak memory grows up to n_loading_threads times, and the
+                              progress bars of the loaders are interleaved. Default: 1
     :return: None
     """
+    # get full daily path
+    daily_folder_path = os.path.join(subject_folder_path, date)
+
+    # generate output folder name and filename (before loading any data, to check whether the plot is up-to-date)
+    # (the date is extracted only once, as it is also needed for the title)
+    date_string = extract_date_from_path(daily_folder_path)
+    group_folder_name = f"group_{extract_group_from_path(daily_folder_path)}"
+    out_filename = f"{group_folder_name}_{extract_device_num_from_path(daily_folder_path)}_{date_string}.png"
+
+    # skip the day if the plot is already up-to-date
+    if not overwrite and _is_plot_up_to_date(os.path.join(os.getcwd(), group_folder_name, out_filename),
+                                             daily_folder_path):
+        return
 
     # Get the dictionary with the lengths and start times
-    acquisitions_dict = _get_daily_acquisitions_metadata(subject_folder_path, date)
+    # (when overwrite is False, the files are already scanned for checking the plot, so the in-place edits of the files
+    # are then also detected by the cache of the signal lengths)
+    acquisitions_dict = _get_daily_acquisitions_metadata(subject_folder_path, date, n_loading_threads=n_loading_threads,
+                                                         check_file_modifications=not overwrite)
 
     # Get the missing data, if any
     missing_data_dict = get_missing_data(subject_folder_path, acquisitions_dict)
@@ -110,9 +198,6 @@ def visualize_daily_acquisitions(subject_folder_path: str, date: str, fs=100) ->
     # only plot if there's any data
     if acquisitions_dict:
 
-        # get full daily path
-        daily_folder_path = os.path.join(subject_folder_path, date)
-
         # change muscleban device name to mBAN right or mBAN left from the dict with the acquisition data
         acquisitions_dict = _normalize_device_names(acquisitions_dict)
 
@@ -128,37 +213,49 @@ def visualize_daily_acquisitions(subject_folder_path: str, date: str, fs=100) ->
         # get the minimum and maximum time ranges (datetime) to put the chunks in order and for the x-axis limits
         min_start_time, latest_end_time = _get_acquisition_time_range(acquisitions_dict, missing_data_dict, fs)
 
-        # Sort acquisitions_dict according to DEVICE_ORDER
+        # Sort acquisitions_dict according to DEVICE_ORDER (taking the devices in the known order, no sorting needed)
+        # devices that are not in DEVICE_ORDER are kept at the end
         acquisitions_dict = {
-            d: acquisitions_dict[d]
-            for d in sorted(acquisitions_dict.keys(),
-                            key=lambda d: DEVICE_ORDER.index(d) if d in DEVICE_ORDER else len(DEVICE_ORDER))
+            **{d: acquisitions_dict[d] for d in DEVICE_ORDER if d in acquisitions_dict},
+            **{d: data for d, data in acquisitions_dict.items() if d not in DEVICE_ORDER}
         }
 
         # Build device_to_index from the union of acquisitions + missing devices
-        all_devices = set(acquisitions_dict.keys()) | set(missing_data_dict.keys())
-        sorted_devices = sorted(all_devices,
-                                key=lambda d: DEVICE_ORDER.index(d) if d in DEVICE_ORDER else len(DEVICE_ORDER))
+        # (dict used as an ordered set, so that devices that are not in DEVICE_ORDER keep a deterministic order)
+        all_devices = dict.fromkeys(acquisitions_dict)
+        all_devices.update(dict.fromkeys(missing_data_dict))
+        sorted_devices = [d for d in DEVICE_ORDER if d in all_devices] + \
+                         [d for d in all_devices if d not in DEVICE_ORDER]
         device_to_index = {device: i for i, device in enumerate(sorted_devices)}
 
+        # get the vertical positions of each device's bar (computed once and shared by all plotting functions)
+        device_y_positions = _get_device_y_positions(device_to_index)
+
         fig, ax = plt.subplots(figsize=(10, 3))
 
-        # Plot acquisitions horizontal bars
-        _plot_device_bars(ax=ax, data_dict=acquisitions_dict, device_to_index=device_to_index, fs=fs, color_map=lambda i: COLOR_PALLETE[i % len(COLOR_PALLETE)], )
+        # the x-axis holds dates (the bars are plotted directly as matplotlib date numbers)
+        ax.xaxis_date()
+
+        # Format the time and set the x-axis limits before adding any artists (as matplotlib date numbers, like the bars)
+        # (setting the limits turns off the x-axis autoscaling, so the artists added below do not trigger it)
+        ax.xaxis.set_major_formatter(DateFormatter("%H:%M"))
+        ax.set_xlim(date2num(min_start_time), date2num(latest_end_time + timedelta(seconds=5)))
+
+        # get acquisitions horizontal bars
+        bars = _get_device_bars(data_dict=acquisitions_dict, device_to_index=device_to_index, device_y_positions=device_y_positions, fs=fs, color_map=lambda i: COLOR_PALLETE[i % len(COLOR_PALLETE)], )
 
-        # Plot missing data horizontal bars
-        _plot_device_bars(ax=ax, data_dict=missing_data_dict, device_to_index=device_to_index, fs=fs, color_map=lambda _: 'lightgray',
-                          edgecolor='#06171C', linestyle='dashed', linewidth=0.8)
+        # get missing data horizontal bars (drawn on top of the acquisitions)
+        bars.extend(_get_device_bars(data_dict=missing_data_dict, device_to_index=device_to_index, device_y_positions=device_y_positions, fs=fs, color_map=lambda _: 'lightgray',
+                                     edgecolor='#06171C', linestyle='dashed', linewidth=0.8))
+
+        # plot all bars at once
+        _plot_bars(ax, bars)
 
         #Add reference acquisition line (20 minutes)
-        _plot_reference_acquisition(ax, acquisitions_dict, missing_data_dict, device_to_index, seconds=20 * 60)
+        _plot_reference_acquisition(ax, acquisitions_dict, missing_data_dict, device_y_positions, seconds=20 * 60)
 
         # plot the dashed guidelines
-        _plot_device_labels_and_guides(ax, device_to_index, min_start_time, latest_end_time)
-
-        # Format the time
-        ax.xaxis.set_major_formatter(DateFormatter("%H:%M"))
-        ax.set_xlim(min_start_time, latest_end_time + timedelta(seconds=5))
+        _plot_device_labels_and_guides(ax, device_y_positions, min_start_time, latest_end_time)
 
         # remove axis lines
         for spine in ['top', 'right', 'left', 'bottom']:
@@ -169,7 +266,7 @@ def visualize_daily_acquisitions(subject_folder_path: str, date: str, fs=100) ->
         ax.set_yticks([])
 
         # get the weekday based on the date - portuguese
-        week_day, date = _get_day_string(extract_date_from_path(daily_folder_path))
+        week_day, date = _get_day_string(date_string)
         ax.set_title(f"{week_day} | {date}", color='#06171C')
 
         # Add legend for missing data
@@ -179,17 +276,16 @@ def visualize_daily_acquisitions(subject_folder_path: str, date: str, fs=100) ->
             handler_map={RefLine: HandlerRefLine()}, loc='upper left', bbox_to_anchor=(1.02, 1.02), frameon=False,
             handleheight=1, handlelength=2, borderaxespad=0.5)
 
-        plt.tight_layout()
-
-        # generate output filename
-        out_filename = (f"group_{extract_group_from_path(daily_folder_path)}_{extract_device_num_from_path(daily_folder_path)}_"
-                        f"{extract_date_from_path(daily_folder_path)}.png")
+        fig.tight_layout()
 
         # generate output path
-        output_path = create_dir(os.getcwd(), f"group_{extract_group_from_path(daily_folder_path)}")
+        output_path = create_dir(os.getcwd(), group_folder_name)
 
         # save plot
-        plt.savefig(os.path.join(output_path, out_filename), dpi=300, bbox_inches='tight')
+        fig.savefig(os.path.join(output_path, out_filename), dpi=300, bbox_inches='tight')
+
+        # close the figure, so that the memory is released when plotting several days in the same process
+        plt.close(fig)
 
 
 
@@ -197,7 +293,8 @@ def visualize_daily_acquisitions(subject_folder_path: str, date: str, fs=100) ->
 # private functions
 # ------------------------------------------------------------------------------------------------------------------- #
 
-def _get_daily_acquisitions_metadata(subject_folder_path: str, date: str) -> Dict[str, Dict[str, list]]:
+def _get_daily_acquisitions_metadata(subject_folder_path: str, date: str, n_loading_threads: int = 1,
+                                     check_file_modifications: bool = False) -> Dict[str, Dict[str, list]]:
     """
     Aggregates signal metadata (length and start time) for each device across multiple acquisitions recorded in a single day.
     This function is intended for data collected from a smartwatch, smartphone, or MuscleBans (Plux Wireless Biosignals),
@@ -210,6 +307,14 @@ def _get_daily_acquisitions_metadata(subject_folder_path: str, date: str) -> Dic
 
     :param subject_folder_path: Path to the folder containing all data from one subject
     :param date: String pertaining to the date of the acquisition (name of the folder)
+    :param n_loading_threads: the maximum number of threads used for loading the acquisitions of the day. If 1, the
+                              acquisitions are loaded sequentially. Each thread holds the raw signals of one
+                              acquisition in memory, so the peak memory grows up to n_loading_threads times, and the
+                              progress bars of the loaders are interleaved. Default: 1
+    :param check_file_modifications: boolean indicating whether the modification times of all files inside each
+                                     acquisition folder should be checked for the cache of the signal lengths, so that
+                                     in-place edits of the files are detected. If False, only the modification time of
+                                     the acquisition folder is checked (a single stat per folder). Default: False
     :return: A dictionary where keys are device names, and values are dictionaries with two lists:
              - 'length': List of signal lengths.
              - 'start_times': List of corresponding start timestamps.
@@ -223,29 +328,35 @@ def _get_daily_acquisitions_metadata(subject_folder_path: str, date: str) -> Dic
 
     daily_folder_path = os.path.join(subject_folder_path, date)
 
-    # iterate through the folders pertaining to the different acquisitions on the same day
-    for acquisition_folder in os.listdir(daily_folder_path):
-
-        # generate folder_path
-        acquisition_folder_path = os.path.join(daily_folder_path, acquisition_folder)
+    # list the folders pertaining to the different acquisitions on the same day (hidden folders are skipped, while
+    # empty folders have no devices and thus add nothing to the final dictionary)
+    with os.scandir(daily_folder_path) as entries:
+        acquisition_entries = [entry for entry in entries if entry.is_dir() and not entry.name.startswith('.')]
 
-        # load signals
-        signals_dict = load.load_data_from_same_recording(acquisition_folder_path)
+    # get the modification time of each folder (used as part of the cache key of the signal lengths). The folders are
+    # sorted by name (acquisition time) so that the acquisitions are always listed in the same order.
+    if check_file_modifications:
+        acquisition_folders = sorted((entry.path, _get_latest_modification_time(entry.path))
+                                     for entry in acquisition_entries)
+    else:
+        acquisition_folders = sorted((entry.path, entry.stat().st_mtime) for entry in acquisition_entries)
 
-        # get lengths of the signals
-        length_dict = _calculate_df_length(signals_dict)
+    # get the number of threads used for loading (no more than the number of acquisitions)
+    n_loading_threads = min(n_loading_threads, len(acquisition_folders))
 
-        # logger file exists
-        if _check_logger_file(acquisition_folder_path):
+    # load the acquisitions of the day sequentially
+    if n_loading_threads <= 1:
+        acquisitions_info = [_get_acquisition_info(*folder) for folder in acquisition_folders]
 
-            # load timestamps of each device based on the logger file
-            start_times_dict = load.load_logger_file_info(acquisition_folder_path)
+    # load the acquisitions of the day in parallel (only the file I/O and parts of the C parser of pandas release the
+    # GIL, so the speed-up is limited to overlapping the reading of the files). The results are returned in the same
+    # order as the folders.
+    else:
+        with ThreadPoolExecutor(max_workers=n_loading_threads) as executor:
+            acquisitions_info = list(executor.map(lambda folder: _get_acquisition_info(*folder), acquisition_folders))
 
-        # no logger file
-        else:
-
-            # extract timestamps from the filename
-            start_times_dict = get_device_filename_timestamp(acquisition_folder_path)
+    # iterate through the acquisitions on the same day (serially, to combine the results)
+    for length_dict, start_times_dict in acquisitions_info:
 
         # combine and store results
         for device in length_dict:
@@ -263,47 +374,101 @@ def _get_daily_acquisitions_metadata(subject_folder_path: str, date: str) -> Dic
     return final_dict
 
 
-def _calculate_df_length(df_dict: Dict[str, pd.DataFrame]) -> Dict[str, int]:
+def _get_acquisition_info(acquisition_folder_path: str, folder_mtime: float) -> Tuple[Dict[str, int], Dict[str, str]]:
     """
-    Calculates the number of rows in each DataFrame contained in a dictionary.
-    It returns a new dictionary with the same keys, where each value is the number of rows (i.e., length)
-    of the corresponding DataFrame.
+    Gets the signal length and the start time of each device for a single acquisition folder.
 
-    :param df_dict: A dictionary mapping keys to pandas DataFrames.
-    :return: A dictionary mapping each key to the number of rows in its corresponding DataFrame.
+    :param acquisition_folder_path: Path to the folder containing the acquisition.
+    :param folder_mtime: Modification time of the acquisition folder (or the latest one of its files) used for caching
+                         the signal lengths.
+    :return: A tuple containing a dictionary mapping each device to its signal length and a dictionary mapping each
+             device to its start time.
     """
-    lengths_dict: Dict[str, int] = {}
+    # get lengths of the signals (the signals are only loaded if the folder was not loaded before or has changed)
+    length_dict = _load_signal_lengths(acquisition_folder_path, folder_mtime)
+
+    # load timestamps of each device based on the logger file
+    # (the folder is scanned only once, both to find the devices and the logger file)
+    start_times_dict = load.load_logger_file_info(acquisition_folder_path)
 
-    for key, df in df_dict.items():
+    # no logger file
+    if start_times_dict is None:
 
-        lengths_dict[key] = df.shape[0]
+        # extract timestamps from the filename
+        start_times_dict = get_device_filename_timestamp(acquisition_folder_path)
 
-    return lengths_dict
+    return length_dict, start_times_dict
 
 
-def _check_logger_file(folder_path: str) -> bool:
+def _is_plot_up_to_date(plot_path: str, daily_folder_path: str) -> bool:
     """
-    Checks if a logger file exists in the specified folder and that it is not empty.
-    Assumes logger file name starts with 'opensignals_ACQUISITION_LOG_' and includes
-    a timestamp.
+    Checks whether the plot of a day already exists and is newer than the daily folder and everything inside it
+    (acquisition folders and files).
 
-    :param folder_path: The path to the folder containing the RAW acquisitions.
-    :return: True if it exists and is not empty, otherwise False.
+    :param plot_path: Path to the PNG file with the plot of the day.
+    :param daily_folder_path: Path to the folder containing the acquisitions of the day.
+    :return: True if the plot exists and is newer than all acquisition files, otherwise False.
     """
-    # Pattern to match the logger file, assuming it starts with LOGGER_FILENAME_PREFIX
-    pattern = os.path.join(folder_path, f'{LOGGER_FILENAME_PREFIX}*')
+    # the plot was not generated yet
+    if not os.path.isfile(plot_path):
+        return False
 
-    # Use glob to find files that match the pattern
-    matching_files = glob.glob(pattern)
+    return os.stat(plot_path).st_mtime >= _get_latest_modification_time(daily_folder_path)
 
-    # iterate through the files that match the logger file prefix - should only be one
-    for file_path in matching_files:
 
-        # gets the first one (and only) that is not empty
-        if os.path.getsize(file_path) > 0:
-            return True
+def _get_latest_modification_time(folder_path: str) -> float:
+    """
+    Gets the latest modification time of a folder and of all files and sub-folders inside it. The files are checked
+    individually, since editing a file in-place does not update the modification time of its folder.
+
+    :param folder_path: Path to the folder.
+    :return: The latest modification time (in seconds since the epoch).
+    """
+    latest_mtime = os.stat(folder_path).st_mtime
+
+    with os.scandir(folder_path) as entries:
 
-    return False
+        for entry in entries:
+
+            # check the contents of the sub-folders
+            if entry.is_dir(follow_symlinks=False):
+                latest_mtime = max(latest_mtime, _get_latest_modification_time(entry.path))
+
+            else:
+                latest_mtime = max(latest_mtime, entry.stat().st_mtime)
+
+    return latest_mtime
+
+
+@lru_cache(maxsize=1024)
+def _load_signal_lengths(acquisition_folder_path: str, folder_mtime: float) -> Dict[str, int]:
+    """
+    Loads the signals of an acquisition folder and returns the number of samples of each device. The results are cached
+    using the folder path and its modification time (or the latest one of its files), so that the (expensive) loading of
+    the signals is done only once per process for each version of the folder.
+
+    :param acquisition_folder_path: Path to the folder containing the acquisition.
+    :param folder_mtime: Modification time of the acquisition folder or the latest one of its files (only used as part
+                         of the cache key).
+    :return: A dictionary mapping each device to the number of samples of its signals.
+    """
+    # load signals
+    signals_dict = load.load_data_from_same_recording(acquisition_folder_path)
+
+    # get lengths of the signals
+    return _calculate_df_length(signals_dict)
+
+
+def _calculate_df_length(df_dict: Dict[str, pd.DataFrame]) -> Dict[str, int]:
+    """
+    Calculates the number of rows in each DataFrame contained in a dictionary.
+    It returns a new dictionary with the same keys, where each value is the number of rows (i.e., length)
+    of the corresponding DataFrame.
+
+    :param df_dict: A dictionary mapping keys to pandas DataFrames.
+    :return: A dictionary mapping each key to the number of rows in its corresponding DataFrame.
+    """
+    return {key: len(df.index) for key, df in df_dict.items()}
 
 
 def _normalize_device_names(acquisitions_dict: Dict[str, Any]) -> Dict[str, Any]:
@@ -317,12 +482,21 @@ def _normalize_device_names(acquisitions_dict: Dict[str, Any]) -> Dict[str, Any]
     # change muscleban device name to mBAN right or mBAN left
     normalized_acquisitions_dict: Dict[str, Any] = {}
 
+    # metadata (only loaded once, when the first muscleban is found)
+    meta_data_df: Optional[pd.DataFrame] = None
+
     # cycle over the devices in the dictionary keys
     for device_raw, data in acquisitions_dict.items():
-        if match := re.search(r'[A-Z0-9]{12}', device_raw):
+
+        # if it's phone or watch keep the device name as it is (checked first, no need to search for a mac address)
+        if device_raw in ANDROID_DEVICES:
+            device = SMART + device_raw
+
+        elif match := MBAN_MAC_PATTERN.search(device_raw):
 
             # load metadata
-            meta_data_df = load.load_meta_data()
+            if meta_data_df is None:
+                meta_data_df = load.load_meta_data()
 
             # get muscleban side and remove '_'
             device = load.get_muscleban_side(meta_data_df, match.group())
@@ -334,7 +508,7 @@ def _normalize_device_names(acquisitions_dict: Dict[str, Any]) -> Dict[str, Any]
             else:
                 device = MBAN_ESQ
 
-        # if it's phone or watch keep the device name as it is
+        # any other device name is kept as it is
         else:
             device = SMART + device_raw
 
@@ -354,12 +528,23 @@ def _get_day_string(date_string: str, locale_string: str = "Portuguese_Portugal.
     # get a datetime object from the date string
     date_time = datetime.strptime(date_string, '%Y-%m-%d')
 
-    # set the locale_string
-    locale.setlocale(locale.LC_TIME, locale_string)
+    # set the locale_string (only done once per process)
+    _set_time_locale(locale_string)
 
     return date_time.strftime('%A'), date_time.strftime('%x')
 
 
+@lru_cache(maxsize=1)
+def _set_time_locale(locale_string: str) -> None:
+    """
+    Sets the locale used for formatting dates and times. Since setting the locale is a process-wide operation, the call
+    is cached so that the locale is only set once per process (and again only if a different locale is requested).
+    :param locale_string: string indicating the locale (e.g., "Portuguese_Portugal.1252")
+    :return: None
+    """
+    locale.setlocale(locale.LC_TIME, locale_string)
+
+
 def _add_missing_device(data_dict: Dict[str, Dict[str, list]], missing_data_dict: Dict[str, Dict[str, list]], fs: int) \
         -> Dict[str, Dict[str, list]]:
     """
@@ -416,18 +601,23 @@ def _add_missing_device(data_dict: Dict[str, Dict[str, list]], missing_data_dict
         return missing_data_dict
 
     # (2) Collect reference times. If the device that was used for reference has no missing start times, use the ones in data_dict.
-    ref_times = data_dict[ref_device][START_TIMES].copy()
+    ref_times = data_dict[ref_device][START_TIMES]
 
     # If the reference device has missing start times, merge the ones on both data_dict and missing_data_dict
     if ref_device in missing_data_dict:
-        ref_times += missing_data_dict[ref_device][START_TIMES]
+        ref_times = ref_times + missing_data_dict[ref_device][START_TIMES]
+
+    # sort the reference times once (a new list, the start times in data_dict are not changed)
+    ref_times = sorted(ref_times)
 
     # (3) Add missing devices data to missing_data_dict, including the length of the acquisitions
+    # (each device gets its own copy of the lists)
+    ref_lengths = [ACQUISITION_TIME_SECONDS * fs] * len(ref_times)
     for dev in missing_devices:
 
         missing_data_dict[dev] = {
-            START_TIMES: sorted(ref_times),
-            LENGTH: [ACQUISITION_TIME_SECONDS * fs] * len(ref_times)
+            START_TIMES: ref_times.copy(),
+            LENGTH: ref_lengths.copy()
         }
 
     return missing_data_dict
@@ -444,76 +634,142 @@ def _get_acquisition_time_range(acquisitions_dict: Dict[str, Dict[str, list]], m
     :return: (min_start_time, latest_end_time) as datetime objects.
     """
 
-    # Initialize boundaries as None (they will be updated in the loop)
-    min_start_time = None
-    latest_end_time = None
-
-    # Iterate over both acquisitions and missing data
+    # Pair up each length with its corresponding start time (in seconds since midnight) for both acquisitions and
+    # missing data - the times are only converted to datetime objects once the boundaries are found
+    start_seconds, end_seconds = [], []
     for data_dict in (acquisitions_dict, missing_data_dict):
-        # Each device has lists of lengths and start times
         for data in data_dict.values():
-            # Pair up each length with its corresponding start time
             for length, start_str in zip(data[LENGTH], data[START_TIMES]):
 
-                # Convert start time string (HH-MM-SS) into datetime object
-                start_dt = datetime.strptime(start_str, "%H-%M-%S")
+                start = time_string_to_seconds(start_str)
+                start_seconds.append(start)
 
                 # Compute end time by adding duration (length / fs seconds)
-                end_dt = start_dt + timedelta(seconds=length / fs)
+                end_seconds.append(start + length / fs)
 
-                # Update minimum start time if this one is earlier
-                if min_start_time is None or start_dt < min_start_time:
-                    min_start_time = start_dt
+    # no acquisitions found
+    if not start_seconds:
+        return None, None
 
-                # Update maximum end time if this one is later
-                if latest_end_time is None or end_dt > latest_end_time:
-                    latest_end_time = end_dt
+    # get the boundaries (as datetime objects on the same reference day as time_string_to_datetime(...))
+    min_start_time = TIME_REFERENCE_DAY + timedelta(seconds=min(start_seconds))
+    latest_end_time = TIME_REFERENCE_DAY + timedelta(seconds=max(end_seconds))
 
-    # Return both boundaries
     return min_start_time, latest_end_time
 
 
-def _plot_device_bars(ax: Axes, data_dict: Dict[str, Dict[str, list]], device_to_index: Dict[str, int], fs: int,
-                      color_map: Union[Callable[[int], str], Dict[str, str]], edgecolor: Optional[str] = None,
-                      linestyle: str = 'solid', linewidth: float = 1.0) -> None:
+@lru_cache(maxsize=1024)
+def _start_time_to_datetime(start_str: str) -> datetime:
     """
-    Plots horizontal bars for each device based on acquisition or missing data.
+    Converts an acquisition start time (HH-MM-SS) into a datetime object. The conversions are cached since the same start
+    times are used for plotting the acquisitions, the missing data, and the reference acquisition.
+
+    :param start_str: The start time string (HH-MM-SS).
+    :return: The start time as a datetime object.
+    """
+    return time_string_to_datetime(start_str)
+
+
+@lru_cache(maxsize=1024)
+def _start_time_to_date_num(start_str: str) -> float:
+    """
+    Converts an acquisition start time (HH-MM-SS) into a matplotlib date number (days since the matplotlib epoch).
+    The conversions are cached for the same reason as in _start_time_to_datetime(...).
+
+    :param start_str: The start time string (HH-MM-SS).
+    :return: The start time as a matplotlib date number.
+    """
+    return date2num(_start_time_to_datetime(start_str))
+
+
+def _get_device_y_positions(device_to_index: Dict[str, int]) -> Dict[str, Tuple[float, float, float]]:
+    """
+    Computes the vertical positions (bottom, center, and top) of the bar of each device.
+
+    :param device_to_index: Mapping from device name to vertical position index.
+    :return: Mapping from device name to the (y_bottom, y_center, y_top) of its bar.
+    """
+    device_y_positions: Dict[str, Tuple[float, float, float]] = {}
+
+    for device, i in device_to_index.items():
+
+        y_center = i * VERTICAL_SPACING
+        device_y_positions[device] = (y_center - BAR_HEIGHT / 2, y_center, y_center + BAR_HEIGHT / 2)
+
+    return device_y_positions
+
+
+def _get_device_bars(data_dict: Dict[str, Dict[str, list]], device_to_index: Dict[str, int],
+                     device_y_positions: Dict[str, Tuple[float, float, float]], fs: int,
+                     color_map: Union[Callable[[int], str], Dict[str, str]], edgecolor: str = 'none',
+                     linestyle: str = 'solid', linewidth: float = 1.0) -> List[Tuple[list, str, str, str, float]]:
+    """
+    Gets the horizontal bars for each device based on acquisition or missing data. The bars are only returned (and not
+    plotted) so that all bars of the plot can be drawn at once with _plot_bars(...).
 
-    :param ax: The matplotlib axis to draw on.
     :param data_dict: Dictionary containing acquisition or missing data.
     :param device_to_index: Mapping from device name to vertical position index.
+    :param device_y_positions: Mapping from device name to the (y_bottom, y_center, y_top) of its bar.
     :param fs: Sampling frequency.
     :param color_map: Function or dict that returns a facecolor given the device index or name.
-    :param edgecolor: Color of bar edge (optional).
+    :param edgecolor: Color of bar edge (default: 'none', no edge).
     :param linestyle: Line style for the bar edge (default: solid).
     :param linewidth: Width of bar edge lines.
+    :return: list with one (vertices, facecolor, edgecolor, linestyle, linewidth) tuple per bar. The vertices are given
+             in matplotlib date numbers (x) and in axis units (y).
     """
+    # list for holding the bars
+    bars = []
+
     for device, data in data_dict.items():
         if device not in device_to_index:
             continue
 
         i = device_to_index[device]
-        y_center = i * VERTICAL_SPACING
-        y_bottom = y_center - BAR_HEIGHT / 2
+        y_bottom, _, y_top = device_y_positions[device]
+
+        facecolor = color_map(i) if callable(color_map) else color_map.get(device, 'gray')
 
         for length, start_str in zip(data[LENGTH], data[START_TIMES]):
             if not start_str:
                 continue
-            start_dt = datetime.strptime(start_str, "%H-%M-%S")
-            duration = timedelta(seconds=length / fs)
 
-            ax.broken_barh(
-                [(start_dt, duration)],
-                (y_bottom, BAR_HEIGHT),
-                facecolors=color_map(i) if callable(color_map) else color_map.get(device, 'gray'),
-                edgecolor=edgecolor,
-                linestyle=linestyle,
-                linewidth=linewidth
-            )
+            # the bars are given in matplotlib date numbers (days), so that matplotlib does not have to convert them
+            x_start = _start_time_to_date_num(start_str)
+            x_end = x_start + length / fs / SECONDS_PER_DAY
+
+            # rectangle (in the same vertex order as ax.broken_barh(...))
+            vertices = [(x_start, y_bottom), (x_start, y_top), (x_end, y_top), (x_end, y_bottom)]
+
+            bars.append((vertices, facecolor, edgecolor, linestyle, linewidth))
+
+    return bars
+
+
+def _plot_bars(ax: Axes, bars: List[Tuple[list, str, str, str, float]]) -> None:
+    """
+    Plots all bars in a single PolyCollection (one artist and one draw call for all bars of the plot). The bars are drawn
+    in the order they are given.
+
+    :param ax: The matplotlib axis to draw on.
+    :param bars: list with one (vertices, facecolor, edgecolor, linestyle, linewidth) tuple per bar, as returned by
+                 _get_device_bars(...).
+    """
+    if not bars:
+        return
+
+    vertices, facecolors, edgecolors, linestyles, linewidths = zip(*bars)
+
+    collection = PolyCollection(np.array(vertices), facecolors=facecolors, edgecolors=edgecolors,
+                                linestyles=linestyles, linewidths=linewidths)
+    ax.add_collection(collection, autolim=True)
+
+    # only the y-axis is autoscaled (the x-axis limits are set beforehand from the acquisition time range)
+    ax.autoscale_view(scalex=False)
 
 
 def _plot_reference_acquisition(ax: Axes, acquisitions_dict: Dict[str, Dict[str, list]], missing_data_dict: Dict[str, Dict[str, list]],
-                                device_to_index: Dict[str, int], seconds: int = 20*60) -> None:
+                                device_y_positions: Dict[str, Tuple[float, float, float]], seconds: int = 20*60) -> None:
     """
     Plots a reference acquisition line (e.g., 20 minutes) on the first available acquisition
     from one of the devices (watch, mBAN right, or mBAN left).
@@ -521,7 +777,7 @@ def _plot_reference_acquisition(ax: Axes, acquisitions_dict: Dict[str, Dict[str,
     :param ax: The matplotlib axis to draw on.
     :param acquisitions_dict: Dictionary of acquisitions with start times and lengths.
     :param missing_data_dict: Dictionary of missing acquisitions with start times and lengths.
-    :param device_to_index: Mapping from device name to vertical index for plotting.
+    :param device_y_positions: Mapping from device name to the (y_bottom, y_center, y_top) of its bar.
     :param seconds: Duration of the reference acquisition in seconds (default: 20 minutes).
     """
     # select the watch to be the bar where the line will be
@@ -532,11 +788,11 @@ def _plot_reference_acquisition(ax: Axes, acquisitions_dict: Dict[str, Dict[str,
 
     # First chunk
     start_str = data_dict[START_TIMES][0]
-    start_dt = datetime.strptime(start_str, "%H-%M-%S")
+    start_dt = _start_time_to_datetime(start_str)
     end_dt = start_dt + timedelta(seconds=seconds)
 
     # Position above bar
-    y_top = device_to_index[ref_device] * VERTICAL_SPACING + BAR_HEIGHT / 2
+    y_top = device_y_positions[ref_device][2]
     offset = 0.1 * BAR_HEIGHT
     y_line = y_top + offset
 
@@ -555,25 +811,29 @@ def _plot_reference_acquisition(ax: Axes, acquisitions_dict: Dict[str, Dict[str,
     )
 
 
-def _plot_device_labels_and_guides(ax: Axes, device_to_index: Dict[str, int], min_start_time: datetime,
+def _plot_device_labels_and_guides(ax: Axes, device_y_positions: Dict[str, Tuple[float, float, float]], min_start_time: datetime,
                                    latest_end_time: datetime) -> None:
     """
     Plot dashed horizontal guidelines and device labels on the y-axis.
 
     :param ax: Matplotlib axis to plot on.
-    :param device_to_index: Dictionary mapping device names to their y-index.
+    :param device_y_positions: Mapping from device name to the (y_bottom, y_center, y_top) of its bar.
     :param min_start_time: Earliest acquisition time (datetime).
     :param latest_end_time: Latest acquisition time (datetime).
     """
+    # vertical positions of the dashed lines (top and bottom of each bar)
+    y_lines = []
+
+    # horizontal position of the labels (the same for all devices) as a matplotlib date number
+    label_x = date2num(min_start_time - timedelta(seconds=500))
+
     # Loop through devices and their vertical positions
-    for device, i in device_to_index.items():
-        # Compute vertical positions for the bar and label
-        y_center = i * VERTICAL_SPACING
-        y_bottom = y_center - BAR_HEIGHT / 2
-        y_top = y_center + BAR_HEIGHT / 2
+    for device, (y_bottom, y_center, y_top) in device_y_positions.items():
 
-        # Draw dashed horizontal lines at the top and bottom of the bar
-        ax.hlines(y=[y_bottom, y_top], xmin=min_start_time, xmax=latest_end_time + timedelta(seconds=5), colors="#06171C", linestyles="dashed", linewidth=1.1)
+        y_lines.extend([y_bottom, y_top])
 
         # Add the device name as a label on the left side
-        ax.text(min_start_time - timedelta(seconds=500), y_center, device, va="center", ha="right", fontsize=12, color="#06171C")
\ No newline at end of file
+        ax.text(label_x, y_center, device, va="center", ha="right", fontsize=12, color="#06171C")
+
+    # Draw dashed horizontal lines at the top and bottom of all bars (a single LineCollection for all devices)
+    ax.hlines(y=y_lines, xmin=date2num(min_start_time), xmax=date2num(latest_end_time + timedelta(seconds=5)), colors="#06171C", linestyles="dashed", linewidth=1.1)
\ No newline at end of file